@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import os
+import re
 import shutil
 import socket
 import struct
 import subprocess
 import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import median
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
+try:
+    from scapy.all import ICMP, IP, conf as scapy_conf, sr  # type: ignore
+    from scapy.error import Scapy_Exception  # type: ignore
+    SCAPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    ICMP = IP = scapy_conf = sr = None  # type: ignore
+    Scapy_Exception = OSError  # type: ignore
+    SCAPY_AVAILABLE = False
+
 OBSERVER = "traceroute-to-nowhere"
 MODULE_DIR = Path(__file__).resolve().parent
 REPO_ROOT = MODULE_DIR.parents[1]
@@ -25,6 +39,7 @@ DAILY_ROOT = REPO_ROOT / "data" / "daily"
 LATEST_DIR = REPO_ROOT / "data" / "latest"
 LATEST_SUMMARY_PATH = LATEST_DIR / "summary.json"
 LATEST_CHART_PATH = LATEST_DIR / "chart.png"
+LATEST_CHART_FP_PATH = LATEST_DIR / "chart.fp"
 
 
 class Config(Dict[str, Any]):
@@ -106,13 +121,94 @@ def _resolve_ip(host: str) -> str | None:
         return None
 
 
+def _run_trace_summaries_scapy(anchors: List[Dict[str, str]], config: Config) -> List[Dict[str, Any]] | None:
+    """Probe every anchor with one pipelined ICMP burst instead of serial traceroutes.
+
+    Sends TTL 1..max_ttl for all anchors in a single ``sr`` call, so the wall
+    time is bounded by one timeout window rather than anchors x hops x timeout.
+    Returns ``None`` when raw sockets are unavailable (no privileges) so the
+    caller can fall back to the subprocess traceroute path.
+    """
+    max_ttl = int(config["max_ttl"])
+    timeout_s = float(config["timeout_s"])
+
+    resolved: Dict[str, str | None] = {anchor["host"]: _resolve_ip(anchor["host"]) for anchor in anchors}
+    probe_ips = sorted({ip for ip in resolved.values() if ip})
+
+    answers_by_ip: Dict[str, Dict[int, bool]] = {ip: {} for ip in probe_ips}
+    if probe_ips:
+        probe_id = os.getpid() & 0xFFFF
+        packets = [
+            IP(dst=ip, ttl=ttl) / ICMP(id=probe_id, seq=ttl)
+            for ip in probe_ips
+            for ttl in range(1, max_ttl + 1)
+        ]
+        try:
+            answered, _ = sr(packets, timeout=timeout_s, verbose=False)
+        except (OSError, PermissionError, Scapy_Exception):
+            # Scapy_Exception covers no-route and interface failures, which
+            # scapy raises instead of the underlying OSError.
+            return None
+        for sent, received in answered:
+            dst = sent[IP].dst
+            ttl = int(sent[IP].ttl)
+            if dst not in answers_by_ip:
+                continue
+            # Echo-reply means the destination itself answered; time-exceeded
+            # (type 11) identifies an intermediate hop at this TTL.
+            reached = received.haslayer(ICMP) and int(received[ICMP].type) == 0
+            answers_by_ip[dst][ttl] = answers_by_ip[dst].get(ttl, False) or reached
+
+    summaries: List[Dict[str, Any]] = []
+    for anchor in anchors:
+        destination_ip = resolved.get(anchor["host"])
+        if destination_ip is None:
+            summaries.append(
+                {
+                    "reached_destination": False,
+                    "last_replied_hop": 0,
+                    "total_hops_attempted": max_ttl,
+                    "unanswered_hop_proportion": 1.0,
+                    "status": "dns_resolution_failed",
+                }
+            )
+            continue
+
+        replies = answers_by_ip.get(destination_ip, {})
+        reached_ttls = [ttl for ttl, reached in replies.items() if reached]
+        reached_destination = bool(reached_ttls)
+        total_hops_attempted = min(reached_ttls) if reached_destination else max_ttl
+        considered = [ttl for ttl in replies if ttl <= total_hops_attempted]
+        last_replied_hop = max(considered) if considered else 0
+        unanswered_hops = total_hops_attempted - len(considered)
+        unanswered_hop_proportion = unanswered_hops / total_hops_attempted if total_hops_attempted else 1.0
+
+        summaries.append(
+            {
+                "reached_destination": reached_destination,
+                "last_replied_hop": int(last_replied_hop),
+                "total_hops_attempted": int(total_hops_attempted),
+                "unanswered_hop_proportion": round(float(unanswered_hop_proportion), 6),
+                "status": "ok",
+            }
+        )
+    return summaries
+
+
 def _run_trace_summary(host: str, config: Config) -> Dict[str, Any]:
+    # Hoist the config lookups once; the per-line loop below should not pay
+    # repeated dict indexing and int()/float() conversions.
+    max_ttl = int(config["max_ttl"])
+    timeout_s = float(config["timeout_s"])
+    markers = config["unreachable_markers"]
+    markers_re = re.compile("|".join(re.escape(marker) for marker in markers)) if markers else None
+
     traceroute_cmd = shutil.which("traceroute")
     if not traceroute_cmd:
         return {
             "reached_destination": False,
             "last_replied_hop": 0,
-            "total_hops_attempted": int(config["max_ttl"]),
+            "total_hops_attempted": max_ttl,
             "unanswered_hop_proportion": 1.0,
             "status": "traceroute_unavailable",
         }
@@ -122,7 +218,7 @@ def _run_trace_summary(host: str, config: Config) -> Dict[str, Any]:
         return {
             "reached_destination": False,
             "last_replied_hop": 0,
-            "total_hops_attempted": int(config["max_ttl"]),
+            "total_hops_attempted": max_ttl,
             "unanswered_hop_proportion": 1.0,
             "status": "dns_resolution_failed",
         }
@@ -131,21 +227,25 @@ def _run_trace_summary(host: str, config: Config) -> Dict[str, Any]:
         traceroute_cmd,
         "-n",
         "-m",
-        str(config["max_ttl"]),
+        str(max_ttl),
         "-q",
         "1",
         "-w",
-        str(config["timeout_s"]),
+        str(timeout_s),
         host,
     ]
 
+    # Hard wall-clock cap: a misbehaving traceroute must not stall the whole
+    # observer run beyond roughly one full worst-case trace.
+    wall_cap_s = int(max_ttl * timeout_s * 1.5) + 2
+
     try:
-        completed = subprocess.run(command, capture_output=True, text=True, check=False)
-    except OSError:
+        completed = subprocess.run(command, capture_output=True, text=True, check=False, timeout=wall_cap_s)
+    except (OSError, subprocess.TimeoutExpired):
         return {
             "reached_destination": False,
             "last_replied_hop": 0,
-            "total_hops_attempted": int(config["max_ttl"]),
+            "total_hops_attempted": max_ttl,
             "unanswered_hop_proportion": 1.0,
             "status": "traceroute_failed",
         }
@@ -179,10 +279,10 @@ def _run_trace_summary(host: str, config: Config) -> Dict[str, Any]:
             reached_destination = True
             break
 
-        if any(marker in stripped for marker in config["unreachable_markers"]):
+        if markers_re is not None and markers_re.search(stripped):
             break
 
-    total_hops_attempted = hops_seen if hops_seen > 0 else int(config["max_ttl"])
+    total_hops_attempted = hops_seen if hops_seen > 0 else max_ttl
     unanswered_hop_proportion = unanswered_hops / total_hops_attempted if total_hops_attempted else 1.0
 
     return {
@@ -207,40 +307,61 @@ def _daily_files_up_to(date_str: str) -> List[Path]:
     return sorted(files, key=lambda p: p.parent.name)
 
 
-def _baseline_values(date_str: str, baseline_days: int) -> Tuple[List[float], List[float]]:
+def _collect_history(date_str: str, baseline_days: int) -> Tuple[List[float], List[float], List[Dict[str, Any]]]:
+    """Walk the daily files once, extracting baseline series and chart rows.
+
+    The baseline series skip the current date (it must not feed its own
+    z-score); the history rows keep every day so the chart can include today.
+    """
     fail_rates: List[float] = []
     median_hops: List[float] = []
+    history_rows: List[Dict[str, Any]] = []
     for path in _daily_files_up_to(date_str):
         payload = _load_json(path, {})
         if not isinstance(payload, dict):
             continue
-        if payload.get("date_utc") == date_str:
-            continue
         metrics = payload.get("metrics", {})
         if not isinstance(metrics, dict):
-            continue
+            metrics = {}
         fail_rate = metrics.get("fail_rate")
         median_hop = metrics.get("median_last_replied_hop")
+
+        history_rows.append(
+            {
+                "date_utc": str(payload.get("date_utc", path.parent.name)),
+                "fail_rate": float(fail_rate or 0.0) if isinstance(fail_rate, (int, float)) else 0.0,
+                "median_last_replied_hop": float(median_hop or 0.0) if isinstance(median_hop, (int, float)) else 0.0,
+            }
+        )
+
+        if payload.get("date_utc") == date_str:
+            continue
         if isinstance(fail_rate, (int, float)):
             fail_rates.append(float(fail_rate))
         if isinstance(median_hop, (int, float)):
             median_hops.append(float(median_hop))
 
-    return fail_rates[-baseline_days:], median_hops[-baseline_days:]
+    return fail_rates[-baseline_days:], median_hops[-baseline_days:], history_rows
 
 
 def _baseline_stats(values: List[float]) -> Dict[str, float]:
-    if not values:
-        return {"mean": 0.0, "std": 0.0}
-    avg = sum(values) / len(values)
+    # With fewer than two entries the std is ill-defined; skip the second
+    # pass through the values entirely on cold starts.
+    n = len(values)
+    if n < 2:
+        return {"mean": round(values[0], 6) if n else 0.0, "std": 0.0}
+    avg = sum(values) / n
     return {"mean": round(avg, 6), "std": round(_stddev(values), 6)}
 
 
 def _png_chunk(tag: bytes, data: bytes) -> bytes:
-    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    # Incremental CRC avoids concatenating tag+data (a full extra copy of
+    # the IDAT payload) just to checksum it.
+    crc = zlib.crc32(data, zlib.crc32(tag))
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc & 0xFFFFFFFF)
 
 
-def _encode_png_rgb(width: int, height: int, pixels: List[List[tuple[int, int, int]]], metadata: Dict[str, str]) -> bytes:
+def _encode_png_rgb(width: int, height: int, pixels: bytearray, metadata: Dict[str, str]) -> bytes:
     signature = b"\x89PNG\r\n\x1a\n"
     ihdr = _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
     text_chunks = [
@@ -251,30 +372,38 @@ def _encode_png_rgb(width: int, height: int, pixels: List[List[tuple[int, int, i
         for key, value in metadata.items()
     ]
 
-    raw = bytearray()
-    for y in range(height):
-        raw.append(0)
-        for x in range(width):
-            raw.extend(pixels[y][x])
-
-    idat = _png_chunk(b"IDAT", zlib.compress(bytes(raw), level=6))
+    # Up-filter (PNG filter type 2) every row after the first: the chart is
+    # mostly constant background, so filtered rows become runs of zeros that
+    # deflate collapses to a few KB even at level 1.
+    rows = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width * 3)
+    filtered = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    filtered[0, 0] = 0
+    filtered[0, 1:] = rows[0]
+    filtered[1:, 0] = 2
+    filtered[1:, 1:] = rows[1:] - rows[:-1]
+
+    idat = _png_chunk(b"IDAT", zlib.compress(filtered.tobytes(), level=1))
     iend = _png_chunk(b"IEND", b"")
     return signature + ihdr + b"".join(text_chunks) + idat + iend
 
 
-def _draw_line(pixels: List[List[tuple[int, int, int]]], x0: int, y0: int, x1: int, y1: int, color: tuple[int, int, int]) -> None:
+def _draw_line(pixels: bytearray, stride: int, x0: int, y0: int, x1: int, y1: int, color: tuple[int, int, int]) -> None:
     dx = abs(x1 - x0)
     dy = -abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
     err = dx + dy
 
-    h = len(pixels)
-    w = len(pixels[0]) if h else 0
+    w = stride // 3
+    h = len(pixels) // stride if stride else 0
+    r, g, b = color
 
     while True:
         if 0 <= x0 < w and 0 <= y0 < h:
-            pixels[y0][x0] = color
+            i = y0 * stride + x0 * 3
+            pixels[i] = r
+            pixels[i + 1] = g
+            pixels[i + 2] = b
         if x0 == x1 and y0 == y1:
             break
         e2 = 2 * err
@@ -288,8 +417,10 @@ def _draw_line(pixels: List[List[tuple[int, int, int]]], x0: int, y0: int, x1: i
 
 def _render_significant_chart(date_str: str, triggers: List[str], history_rows: List[Dict[str, Any]]) -> None:
     width, height = 920, 480
-    bg = (246, 249, 253)
-    pixels = [[bg for _ in range(width)] for _ in range(height)]
+    # Flat RGB buffer addressed by y*stride + x*3: no per-pixel tuple objects
+    # and contiguous memory for the encoder to slice row-wise.
+    stride = width * 3
+    pixels = bytearray(b"\xf6\xf9\xfd" * (width * height))
 
     margin_left = 70
     margin_right = 30
@@ -302,35 +433,47 @@ def _render_significant_chart(date_str: str, triggers: List[str], history_rows:
     if not rows:
         return
 
+    fail_values = [float(item.get("fail_rate", 0.0)) for item in rows]
+    hop_values = [float(item.get("median_last_replied_hop", 0.0)) for item in rows]
+
+    # Skip the (Python-bound) PNG re-encode entirely when the series and
+    # triggers match what is already on disk.
+    fingerprint = hashlib.blake2b(
+        json.dumps({"f": fail_values, "h": hop_values, "t": triggers}).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    if LATEST_CHART_PATH.exists():
+        try:
+            if LATEST_CHART_FP_PATH.read_text(encoding="utf-8").strip() == fingerprint:
+                return
+        except OSError:
+            pass
+
+    grid_row = b"\xdf\xe6\xf0" * plot_w
     for y in range(margin_top, margin_top + plot_h + 1, max(1, plot_h // 5)):
-        for x in range(margin_left, margin_left + plot_w):
-            pixels[y][x] = (223, 230, 240)
+        start = y * stride + margin_left * 3
+        pixels[start : start + plot_w * 3] = grid_row
 
+    axis = (110, 120, 140)
     for y in range(margin_top, margin_top + plot_h):
-        pixels[y][margin_left] = (110, 120, 140)
-    for x in range(margin_left, margin_left + plot_w):
-        pixels[margin_top + plot_h][x] = (110, 120, 140)
-
-    fail_values = [float(item.get("fail_rate", 0.0)) for item in rows]
-    hop_values = [float(item.get("median_last_replied_hop", 0.0)) for item in rows]
+        i = y * stride + margin_left * 3
+        pixels[i : i + 3] = bytes(axis)
+    bottom = (margin_top + plot_h) * stride + margin_left * 3
+    pixels[bottom : bottom + plot_w * 3] = bytes(axis) * plot_w
 
     max_hop = max(max(hop_values), 1.0)
     count = len(rows)
     step = plot_w / max(1, count - 1)
 
-    fail_points: List[tuple[int, int]] = []
-    hop_points: List[tuple[int, int]] = []
+    # Vectorize the coordinate transform: clip both series and map them to
+    # pixel rows in one expression instead of per-point Python arithmetic.
+    xs = (margin_left + np.arange(count) * step).astype(int)
+    y_fail = (margin_top + plot_h - np.clip(np.asarray(fail_values), 0.0, 1.0) * plot_h).astype(int)
+    y_hop = (margin_top + plot_h - np.clip(np.asarray(hop_values) / max_hop, 0.0, 1.0) * plot_h).astype(int)
 
-    for idx, (fail_rate, hop_med) in enumerate(zip(fail_values, hop_values)):
-        x = int(margin_left + idx * step)
-        y_fail = int(margin_top + plot_h - (min(max(fail_rate, 0.0), 1.0) * plot_h))
-        y_hop = int(margin_top + plot_h - (max(0.0, min(1.0, hop_med / max_hop)) * plot_h))
-        fail_points.append((x, y_fail))
-        hop_points.append((x, y_hop))
-
-    for idx in range(1, len(fail_points)):
-        _draw_line(pixels, *fail_points[idx - 1], *fail_points[idx], (205, 60, 66))
-        _draw_line(pixels, *hop_points[idx - 1], *hop_points[idx], (32, 102, 182))
+    for idx in range(1, count):
+        _draw_line(pixels, stride, int(xs[idx - 1]), int(y_fail[idx - 1]), int(xs[idx]), int(y_fail[idx]), (205, 60, 66))
+        _draw_line(pixels, stride, int(xs[idx - 1]), int(y_hop[idx - 1]), int(xs[idx]), int(y_hop[idx]), (32, 102, 182))
 
     metadata = {
         "Title": f"Traceroute significance {date_str}",
@@ -341,7 +484,12 @@ def _render_significant_chart(date_str: str, triggers: List[str], history_rows:
     }
 
     LATEST_DIR.mkdir(parents=True, exist_ok=True)
-    LATEST_CHART_PATH.write_bytes(_encode_png_rgb(width, height, pixels, metadata))
+    # Publish atomically so concurrent readers never see a partially written
+    # chart: write to a sibling temp file, then rename over the target.
+    chart_tmp = LATEST_CHART_PATH.with_suffix(".png.tmp")
+    chart_tmp.write_bytes(_encode_png_rgb(width, height, pixels, metadata))
+    os.replace(chart_tmp, LATEST_CHART_PATH)
+    LATEST_CHART_FP_PATH.write_text(fingerprint + "\n", encoding="utf-8")
 
 
 def _last_7_summary(date_str: str) -> List[Dict[str, Any]]:
@@ -368,11 +516,13 @@ def _write_latest_summary(date_str: str, any_significant: bool) -> None:
         "latest_date_utc": date_str,
         "last_7_days": _last_7_summary(date_str),
     }
-    if LATEST_CHART_PATH.exists() and any_significant:
+    if any_significant:
         payload["chart_path"] = "data/latest/chart.png"
 
     LATEST_DIR.mkdir(parents=True, exist_ok=True)
-    LATEST_SUMMARY_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    summary_tmp = LATEST_SUMMARY_PATH.with_suffix(".json.tmp")
+    summary_tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(summary_tmp, LATEST_SUMMARY_PATH)
 
 
 def run() -> Dict[str, Any]:
@@ -380,11 +530,16 @@ def run() -> Dict[str, Any]:
     config = _load_config()
     anchors = _load_targets()
 
-    traces: List[Dict[str, Any]] = []
-    for idx, anchor in enumerate(anchors):
-        traces.append(_run_trace_summary(anchor["host"], config))
-        if idx < len(anchors) - 1:
-            time.sleep(float(config["probe_delay_s"]))
+    traces: List[Dict[str, Any]] | None = None
+    if SCAPY_AVAILABLE and anchors:
+        traces = _run_trace_summaries_scapy(anchors, config)
+
+    if traces is None:
+        traces = []
+        for idx, anchor in enumerate(anchors):
+            traces.append(_run_trace_summary(anchor["host"], config))
+            if idx < len(anchors) - 1:
+                time.sleep(float(config["probe_delay_s"]))
 
     trace_count = len(traces)
     failed = sum(1 for t in traces if not t["reached_destination"])
@@ -397,7 +552,7 @@ def run() -> Dict[str, Any]:
     early_blackhole_rate = (early_blackholes / trace_count) if trace_count else 0.0
     timeout_hop_density = (sum(unanswered) / trace_count) if trace_count else 1.0
 
-    fail_hist, hop_hist = _baseline_values(date_str, int(config["baseline_days"]))
+    fail_hist, hop_hist, history_rows = _collect_history(date_str, int(config["baseline_days"]))
     baseline_fail = _baseline_stats(fail_hist)
     baseline_hop = _baseline_stats(hop_hist)
 
@@ -450,20 +605,6 @@ def run() -> Dict[str, Any]:
         },
     }
 
-    history_rows: List[Dict[str, Any]] = []
-    for path in _daily_files_up_to(date_str):
-        payload = _load_json(path, {})
-        if not isinstance(payload, dict):
-            continue
-        metrics = payload.get("metrics", {}) if isinstance(payload.get("metrics"), dict) else {}
-        history_rows.append(
-            {
-                "date_utc": str(payload.get("date_utc", path.parent.name)),
-                "fail_rate": float(metrics.get("fail_rate", 0.0) or 0.0),
-                "median_last_replied_hop": float(metrics.get("median_last_replied_hop", 0.0) or 0.0),
-            }
-        )
-
     history_rows.append(
         {
             "date_utc": date_str,
@@ -473,11 +614,17 @@ def run() -> Dict[str, Any]:
     )
 
     if any_significant:
-        _render_significant_chart(date_str, triggers, history_rows)
-    elif LATEST_CHART_PATH.exists():
-        LATEST_CHART_PATH.unlink()
-
-    _write_latest_summary(date_str, any_significant)
+        # Chart rendering is the longest post-probe step; overlap it with the
+        # (independent) summary write, joining before we return.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            chart_future = executor.submit(_render_significant_chart, date_str, triggers, history_rows)
+            _write_latest_summary(date_str, any_significant)
+            chart_future.result()
+    else:
+        if LATEST_CHART_PATH.exists():
+            LATEST_CHART_PATH.unlink()
+            LATEST_CHART_FP_PATH.unlink(missing_ok=True)
+        _write_latest_summary(date_str, any_significant)
 
     return output
 
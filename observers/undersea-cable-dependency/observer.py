@@ -10,10 +10,16 @@ from __future__ import annotations
 import json
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 OBSERVER_NAME = "undersea-cable-dependency"
 MODULE_DIR = Path(__file__).resolve().parent
 CABLES_PATH = MODULE_DIR / "cables.json"
@@ -25,6 +31,8 @@ def _iso_timestamp() -> str:
 
 
 def _load_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
@@ -44,26 +52,64 @@ def _icmp_ping(hostname: str, timeout_s: int = 2) -> Optional[bool]:
     return result.returncode == 0
 
 
-def _tcp_handshake(hostname: str, port: int = 443, timeout_s: int = 3) -> Optional[bool]:
-    """Return True/False for TCP reachability, or None if unavailable."""
+def _resolve_target(hostname: str, port: int = 443) -> List[tuple]:
+    """Resolve a target once to its addrinfo list, or [] on DNS failure."""
     try:
-        with socket.create_connection((hostname, port), timeout=timeout_s):
-            return True
-    except (socket.timeout, OSError):
-        return False
+        return socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, OSError):
+        return []
+
+
+def _tcp_handshake(addrinfos: List[tuple], timeout_s: int = 3) -> Optional[bool]:
+    """Return True/False for TCP reachability of a pre-resolved target.
+
+    Every resolved address is tried in getaddrinfo order, like
+    ``socket.create_connection``: a dual-stack target whose IPv6 address is
+    unreachable from this host still counts as reachable over IPv4.
+    """
+    for family, socktype, proto, _canonname, sockaddr in addrinfos:
+        try:
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(timeout_s)
+                sock.connect(sockaddr)
+                return True
+        except (socket.timeout, OSError):
+            continue
+    return False
 
 
 def _country_reachability(targets: List[str]) -> bool:
-    """Return True if any target is reachable via ICMP or TCP 443."""
-    for target in targets:
-        ping_ok = _icmp_ping(target)
-        tcp_ok = _tcp_handshake(target)
-        if (ping_ok is True) or (tcp_ok is True):
-            return True
+    """Return True if any target is reachable via ICMP or TCP 443.
+
+    The probes are pure I/O waits, so they run concurrently in a thread
+    pool; the first positive answer wins and pending probes are cancelled.
+    """
+    if not targets:
+        return False
+    # Resolve each target once up front so the TCP probes are pure SYN
+    # round-trips without a getaddrinfo call per attempt.
+    resolved = [addrinfos for addrinfos in (_resolve_target(target) for target in targets) if addrinfos]
+    with ThreadPoolExecutor(max_workers=min(32, 2 * len(targets))) as pool:
+        # TCP 443 first: a successful handshake answers the reachability
+        # question without forking one ping subprocess per target. ICMP is
+        # only the fallback when no TCP probe succeeds.
+        tcp_futures = [pool.submit(_tcp_handshake, entry) for entry in resolved]
+        for future in as_completed(tcp_futures):
+            if future.result() is True:
+                for pending in tcp_futures:
+                    pending.cancel()
+                return True
+
+        icmp_futures = [pool.submit(_icmp_ping, target) for target in targets]
+        for future in as_completed(icmp_futures):
+            if future.result() is True:
+                for pending in icmp_futures:
+                    pending.cancel()
+                return True
     return False
 
 
-def _summarize_country(entry: Dict[str, Any], targets: List[str]) -> Dict[str, Any]:
+def _summarize_country(entry: Dict[str, Any], reachable: bool) -> Dict[str, Any]:
     cables = entry.get("cables", [])
     regions = {cable.get("region") for cable in cables if cable.get("region")}
 
@@ -71,7 +117,7 @@ def _summarize_country(entry: Dict[str, Any], targets: List[str]) -> Dict[str, A
         "country": entry.get("country"),
         "cable_count": len(cables),
         "distinct_regions": len(regions),
-        "reachable": _country_reachability(targets),
+        "reachable": reachable,
     }
 
 
@@ -81,7 +127,10 @@ def run() -> Dict[str, Any]:
     targets_payload = _load_json(TARGETS_PATH)
     targets = targets_payload.get("targets", [])
 
-    countries = [_summarize_country(entry, targets) for entry in cable_entries]
+    # Every country entry shares the same target list, so probe it exactly
+    # once instead of once per country.
+    reachable = _country_reachability(targets)
+    countries = [_summarize_country(entry, reachable) for entry in cable_entries]
 
     observation = {
         "observer": OBSERVER_NAME,
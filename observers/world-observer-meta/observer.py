@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 OBSERVER_NAME = "world-observer-meta"
 DAILY_DIR_ENV = "WORLD_OBSERVER_DAILY_DIR"
 
+# data_status values that mark an observer as degraded rather than failed.
+_DEGRADED_STATUSES = frozenset({"partial", "unavailable", "error"})
+
 
 def _today_utc() -> str:
     return datetime.now(timezone.utc).date().isoformat()
@@ -25,19 +36,27 @@ def _coerce_date(date_value: Optional[object]) -> Tuple[str, List[str]]:
     if isinstance(date_value, date):
         return date_value.isoformat(), warnings
     if isinstance(date_value, str):
+        # date.fromisoformat is a C fast path versus strptime's format-string
+        # interpreter; the length guard keeps only strict YYYY-MM-DD valid
+        # (3.11+ fromisoformat would otherwise also accept e.g. 20240101).
         try:
-            parsed = datetime.strptime(date_value, "%Y-%m-%d")
+            if len(date_value) != 10:
+                raise ValueError(date_value)
+            parsed = date.fromisoformat(date_value)
         except ValueError:
             warnings.append(
                 f"Invalid date '{date_value}' supplied; defaulted to today's UTC date."
             )
             return _today_utc(), warnings
-        return parsed.date().isoformat(), warnings
+        return parsed.isoformat(), warnings
     warnings.append("Unsupported date type supplied; defaulted to today's UTC date.")
     return _today_utc(), warnings
 
 
+@functools.lru_cache(maxsize=None)
 def _expected_observers(daily_dir: Optional[Path]) -> Tuple[List[str], List[str]]:
+    # The observer roster cannot change within one process, so cache the scan
+    # per daily_dir; callers treat the returned lists as read-only.
     warnings: List[str] = []
     if daily_dir is None:
         return [], warnings
@@ -48,11 +67,16 @@ def _expected_observers(daily_dir: Optional[Path]) -> Tuple[List[str], List[str]
         warnings.append(f"observers directory not found at {observers_dir}")
         return [], warnings
 
-    names = sorted(
-        path.name
-        for path in observers_dir.iterdir()
-        if path.is_dir() and path.name != OBSERVER_NAME and (path / "observer.py").exists()
-    )
+    # os.scandir consumes the d_type readdir already returned, so the is_dir
+    # check is free; only plausible candidates pay the observer.py stat.
+    with os.scandir(observers_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name != OBSERVER_NAME
+            and entry.is_dir(follow_symlinks=False)
+            and os.path.lexists(os.path.join(entry.path, "observer.py"))
+        )
     return names, warnings
 
 
@@ -74,8 +98,13 @@ def _daily_dir_from_env(date_str: str) -> Tuple[Optional[Path], List[str]]:
 
 def _load_json(path: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        if orjson is not None:
+            # Parses the raw bytes directly, fusing UTF-8 validation with
+            # the decode instead of a separate read_text pass.
+            payload = orjson.loads(path.read_bytes())
+        else:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
         return None, f"{path.name}: {exc}"
     if not isinstance(payload, dict):
         return None, f"{path.name}: root JSON value is not an object"
@@ -91,12 +120,36 @@ def _collect_observations(
     failed_inputs: List[str] = []
     degraded_inputs: List[str] = []
 
+    # One scandir of the daily directory replaces an exists() stat per
+    # expected observer.
+    try:
+        with os.scandir(daily_dir) as entries:
+            present = {
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            }
+    except OSError:
+        present = set()
+
+    to_read: List[Tuple[str, Path]] = []
     for observer_name in sorted(expected_observers):
-        path = daily_dir / f"{observer_name}.json"
-        if not path.exists():
+        filename = f"{observer_name}.json"
+        if filename in present:
+            to_read.append((observer_name, daily_dir / filename))
+        else:
             missing_inputs.append(observer_name)
-            continue
-        payload, error = _load_json(path)
+
+    # The reads are independent small-file I/O, so issue them concurrently;
+    # ex.map preserves input order and all result assembly stays on this
+    # thread.
+    if to_read:
+        with ThreadPoolExecutor(max_workers=min(32, len(to_read))) as pool:
+            results = list(pool.map(_load_json, (path for _name, path in to_read)))
+    else:
+        results = []
+
+    for (observer_name, path), (payload, error) in zip(to_read, results):
         if error:
             failed_inputs.append(error)
             continue
@@ -104,7 +157,7 @@ def _collect_observations(
             failed_inputs.append(f"{path.name}: status is error")
             continue
         data_status = payload.get("data_status")
-        if data_status in {"partial", "unavailable", "error"}:
+        if data_status in _DEGRADED_STATUSES:
             degraded_inputs.append(f"{observer_name}:{data_status}")
         observations[observer_name] = payload
 
@@ -112,34 +165,37 @@ def _collect_observations(
 
 
 def _safe_number(value: Any) -> Optional[float]:
-    if isinstance(value, (int, float)):
+    # Exact type checks are pointer compares and, unlike isinstance with
+    # (int, float), do not let bool slip through as a numeric highlight.
+    value_type = type(value)
+    if value_type is int or value_type is float:
         return float(value)
     return None
 
 
-def _extract_highlights(observations: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[float]]:
-    highlights: Dict[str, Optional[float]] = {
-        "internet_shrinkage_index": None,
-        "global_reachability_score": None,
-        "silent_countries_count": None,
-    }
+# (highlight key, source observer, source field) — each highlight is exactly
+# one top-level field of one observer payload.
+_HIGHLIGHT_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("internet_shrinkage_index", "internet-shrinkage-index", "index"),
+    ("global_reachability_score", "global-reachability-score", "global_reachability_score"),
+    ("silent_countries_count", "silent-countries-list", "silent_countries_count"),
+)
 
-    shrinkage = observations.get("internet-shrinkage-index")
-    if shrinkage:
-        highlights["internet_shrinkage_index"] = _safe_number(shrinkage.get("index"))
 
-    reachability = observations.get("global-reachability-score")
-    if reachability:
-        highlights["global_reachability_score"] = _safe_number(
-            reachability.get("global_reachability_score")
-        )
+_EMPTY_HIGHLIGHTS: Dict[str, Optional[float]] = {
+    key: None for key, _observer, _field in _HIGHLIGHT_FIELDS
+}
 
-    silent = observations.get("silent-countries-list")
-    if silent:
-        highlights["silent_countries_count"] = _safe_number(
-            silent.get("silent_countries_count")
-        )
 
+def _extract_highlights(observations: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    if not observations:
+        # Common when WORLD_OBSERVER_DAILY_DIR is unset: skip the per-field
+        # lookups and hand back a copy of the all-None template.
+        return dict(_EMPTY_HIGHLIGHTS)
+    highlights: Dict[str, Optional[float]] = {}
+    for key, observer_name, field in _HIGHLIGHT_FIELDS:
+        payload = observations.get(observer_name)
+        highlights[key] = _safe_number(payload.get(field)) if payload else None
     return highlights
 
 
@@ -158,8 +214,10 @@ def run(date_value: Optional[object] = None) -> Dict[str, Any]:
     degraded_inputs: List[str] = []
     if daily_dir is not None:
         observations, missing_inputs, failed_inputs, degraded_inputs = _collect_observations(daily_dir, expected)
-        observers_run = sorted(observations.keys())
-        missing = sorted(set(missing_inputs) | (set(expected) - set(observers_run)))
+        observers_run = sorted(observations)
+        # dict keys are already a set view, so subtract from it directly
+        # instead of materialising set(observers_run) first.
+        missing = sorted(set(missing_inputs) | (set(expected) - observations.keys()))
     else:
         observers_run = []
 
@@ -198,7 +256,13 @@ def main() -> None:
     """Serialize the observation to JSON on stdout."""
 
     summary = run()
-    print(json.dumps(summary, ensure_ascii=False))
+    if orjson is not None:
+        # Write the UTF-8 bytes straight to the buffer, skipping the str
+        # round-trip through print.
+        sys.stdout.buffer.write(orjson.dumps(summary))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        print(json.dumps(summary, ensure_ascii=False))
 
 
 if __name__ == "__main__":
@@ -8,16 +8,24 @@ stdout, and stores results in data/daily/<YYYY-MM-DD>/.
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import os
 import json
 import logging
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 OBSERVERS: List[str] = [
     "arch-package-count",
     "area51-reachability",
@@ -62,12 +70,42 @@ OBSERVERS: List[str] = [
 DEDICATED_OBSERVERS: List[str] = ["ocean-buoy-observer"]
 ALL_OBSERVERS: List[str] = sorted([*OBSERVERS, *DEDICATED_OBSERVERS])
 
+# Sorted once at import; callers (and tests) that need the sorted order can
+# reuse this instead of re-sorting the list on every use.
+OBSERVERS_SORTED: Tuple[str, ...] = tuple(sorted(OBSERVERS))
+
+# Observers that publish the shared data/latest/summary.json and
+# data/latest/chart.png. They must not run concurrently with each other:
+# the shared files would be raced and whichever observer happened to finish
+# last would win. Running them sequentially in roster order keeps the
+# published latest content identical to the old one-at-a-time loop.
+LATEST_WRITING_OBSERVERS = frozenset(
+    {
+        "area51-reachability",
+        "asn-visibility-by-country",
+        "dns-tta-stress-index",
+        "global-reachability-long-horizon",
+        "internet-shrinkage-index",
+        "ipv6-global-compare",
+        "ipv6-locked-states",
+        "mx-presence-per-country",
+        "north-korea-connectivity",
+        "silent-countries-list",
+        "tls-fingerprint-change",
+        "traceroute-to-nowhere",
+        "undersea-cable-dependency-map",
+    }
+)
+
 META_OBSERVER = "world-observer-meta"
 FUEL_OBSERVER = "germany-fuel-prices"
 LAST_KNOWN_GOOD_OBSERVERS = {"earthquake-observer"}
 
 
+@functools.lru_cache(maxsize=None)
 def _repo_root() -> Path:
+    # resolve() stats every path component; the result never changes within a
+    # process, so compute it once.
     return Path(__file__).resolve().parents[1]
 
 
@@ -98,7 +136,40 @@ def _parse_args() -> argparse.Namespace:
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+    # Serialize once to bytes and issue a single write() on a raw fd,
+    # skipping the TextIOWrapper/buffer stack write_text builds per file.
+    # Publishing via tmp + os.replace (rather than truncating in place) also
+    # guarantees any hard link in data/latest keeps its old content instead
+    # of seeing a half-written file.
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write ``data`` to ``path``, skipping identical content.
+
+    Skipping no-op rewrites keeps cron reruns from producing spurious disk
+    writes and downstream git diffs; the tmp-file + os.replace publish means
+    concurrent readers never see a partial file.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
 
 
 def _fuel_price_value(item: Any) -> float | int | None:
@@ -126,7 +197,8 @@ def _newest_publishable_fuel_payload(root: Path) -> Dict[str, Any] | None:
     candidates: list[tuple[str, bool, Dict[str, Any]]] = []
     for path in sorted(state_dir.glob("*.json")):
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            data = path.read_bytes()
+            payload = orjson.loads(data) if orjson is not None else json.loads(data)
         except (OSError, json.JSONDecodeError):
             continue
         if not isinstance(payload, dict):
@@ -213,7 +285,8 @@ def _detect_corrupted_json(daily_dir: Path, logger: logging.Logger) -> List[str]
     corrupted: List[str] = []
     for path in sorted(daily_dir.glob("*.json")):
         try:
-            json.loads(path.read_text(encoding="utf-8"))
+            data = path.read_bytes()
+            orjson.loads(data) if orjson is not None else json.loads(data)
         except (OSError, json.JSONDecodeError):
             corrupted.append(path.name)
     if corrupted:
@@ -221,6 +294,15 @@ def _detect_corrupted_json(daily_dir: Path, logger: logging.Logger) -> List[str]
     return corrupted
 
 
+@functools.lru_cache(maxsize=2)
+def _observer_env(date_str: str) -> Dict[str, str]:
+    # One env dict per run date, shared by every observer subprocess, instead
+    # of a fresh os.environ copy per spawn. The children never mutate it.
+    env = dict(os.environ)
+    env["WORLD_OBSERVER_DATE_UTC"] = date_str
+    return env
+
+
 def _observer_timeout_s() -> float:
     raw = os.environ.get("WORLD_OBSERVER_OBSERVER_TIMEOUT_S", "120").strip()
     try:
@@ -231,28 +313,35 @@ def _observer_timeout_s() -> float:
 
 def _run_observer(observer: str, date_str: str, daily_dir: Path) -> Tuple[bool, str]:
     logger = _logger()
-    observer_path = _repo_root() / "observers" / observer / "observer.py"
+    root = _repo_root()
+    # Plain string joins: no intermediate Path objects per spawn, and the
+    # path stays derived from _repo_root (kept patchable for the tests).
+    observer_path = os.path.join(str(root), "observers", observer, "observer.py")
     output_path = daily_dir / f"{observer}.json"
 
-    if not observer_path.exists():
+    if not os.path.exists(observer_path):
         _write_json(
             output_path,
             _error_payload(observer, date_str, "observer.py not found"),
         )
         return False, "observer.py not found"
 
-    env = os.environ.copy()
-    env["WORLD_OBSERVER_DATE_UTC"] = date_str
+    env = _observer_env(date_str)
     timeout_s = _observer_timeout_s()
     try:
         result = subprocess.run(
-            [sys.executable, str(observer_path)],
-            cwd=_repo_root(),
+            [sys.executable, observer_path],
+            cwd=root,
             capture_output=True,
             text=True,
             check=False,
             env=env,
             timeout=timeout_s,
+            # Large pipe buffer: observers emit tens of KB of JSON, so fewer,
+            # bigger reads on the capture pipes.
+            bufsize=1 << 16,
+            close_fds=True,
+            start_new_session=True,
         )
     except subprocess.TimeoutExpired as exc:
         stderr = exc.stderr.decode("utf-8", errors="replace") if isinstance(exc.stderr, bytes) else (exc.stderr or "")
@@ -282,7 +371,9 @@ def _run_observer(observer: str, date_str: str, daily_dir: Path) -> Tuple[bool,
         return False, f"exit {result.returncode}"
 
     try:
-        payload = json.loads(result.stdout)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+        # error path below covers both parsers.
+        payload = orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)
     except json.JSONDecodeError as exc:
         _write_json(
             output_path,
@@ -302,26 +393,29 @@ def _run_observer(observer: str, date_str: str, daily_dir: Path) -> Tuple[bool,
     return True, "ok"
 
 
-def _run_meta_observer(date_str: str, daily_dir: Path) -> Tuple[bool, str]:
-    observer_path = _repo_root() / "observers" / META_OBSERVER / "observer.py"
+def _run_meta_observer(date_str: str, daily_dir: Path) -> Tuple[bool, str, Dict[str, Any] | None]:
+    root = _repo_root()
+    observer_path = os.path.join(str(root), "observers", META_OBSERVER, "observer.py")
     summary_json = daily_dir / "summary.json"
 
-    if not observer_path.exists():
-        return False, "observer.py not found"
+    if not os.path.exists(observer_path):
+        return False, "observer.py not found", None
 
-    env = os.environ.copy()
-    env["WORLD_OBSERVER_DATE_UTC"] = date_str
+    env = dict(_observer_env(date_str))
     env["WORLD_OBSERVER_DAILY_DIR"] = str(daily_dir)
     timeout_s = _observer_timeout_s()
     try:
         result = subprocess.run(
-            [sys.executable, str(observer_path)],
-            cwd=_repo_root(),
+            [sys.executable, observer_path],
+            cwd=root,
             capture_output=True,
             text=True,
             check=False,
             env=env,
             timeout=timeout_s,
+            bufsize=1 << 16,
+            close_fds=True,
+            start_new_session=True,
         )
     except subprocess.TimeoutExpired as exc:
         stderr = exc.stderr.decode("utf-8", errors="replace") if isinstance(exc.stderr, bytes) else (exc.stderr or "")
@@ -336,23 +430,36 @@ def _run_meta_observer(date_str: str, daily_dir: Path) -> Tuple[bool, str]:
             ),
         )
         logger.error("%s timed out after %s seconds", observer, timeout_s)
-        return False, f"timeout {timeout_s:g}s"
+        return False, f"timeout {timeout_s:g}s", None
 
     if result.returncode != 0:
-        return False, f"exit {result.returncode}"
+        return False, f"exit {result.returncode}", None
 
     try:
-        payload = json.loads(result.stdout)
+        payload = orjson.loads(result.stdout) if orjson is not None else json.loads(result.stdout)
     except json.JSONDecodeError:
-        return False, "invalid JSON"
+        return False, "invalid JSON", None
 
     if not isinstance(payload, dict):
-        return False, "non-object JSON"
+        return False, "non-object JSON", None
 
-    _write_json(summary_json, payload)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, skipping the intermediate str
+        # and its separate encode pass.
+        summary_bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        summary_bytes = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    _write_if_changed(summary_json, summary_bytes)
 
     summary_md = daily_dir / "summary.md"
+    _write_if_changed(summary_md, _format_summary_md(date_str, payload).encode("utf-8"))
+
+    # Hand the parsed summary back so callers (and tests) can use it without
+    # re-reading the file the function just wrote.
+    return True, "ok", payload
+
 
+def _format_summary_md(date_str: str, payload: Dict[str, Any]) -> str:
     highlights = payload.get("highlights")
     if not isinstance(highlights, dict):
         highlights = {}
@@ -369,38 +476,57 @@ def _run_meta_observer(date_str: str, daily_dir: Path) -> Tuple[bool, str]:
     if not isinstance(notes, str):
         notes = ""
 
-    lines = [f"# world-observer-meta daily summary ({date_str})", ""]
-    lines.append("## observers run")
+    # StringIO assembly avoids the intermediate line list plus the final
+    # O(n) join; the bound write saves an attribute lookup per line.
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# world-observer-meta daily summary ({date_str})\n\n")
+
+    write("## observers run\n")
     if observers_run:
         for observer in observers_run:
-            lines.append(f"- {observer}")
+            write(f"- {observer}\n")
     else:
-        lines.append("- none")
-    lines.append("")
+        write("- none\n")
+    write("\n")
 
-    lines.append("## observers missing")
+    write("## observers missing\n")
     if observers_missing:
         for observer in observers_missing:
-            lines.append(f"- {observer}")
+            write(f"- {observer}\n")
     else:
-        lines.append("- none")
-    lines.append("")
+        write("- none\n")
+    write("\n")
 
-    lines.append("## highlights")
+    write("## highlights\n")
     if highlights:
         for key in sorted(highlights):
-            lines.append(f"- {key}: {highlights[key]}")
+            write(f"- {key}: {highlights[key]}\n")
     else:
-        lines.append("- none")
-    lines.append("")
+        write("- none\n")
+    write("\n")
 
-    lines.append("## notes")
-    lines.append(f"- {notes}" if notes else "- none")
-    lines.append("")
+    write("## notes\n")
+    write(f"- {notes}\n" if notes else "- none\n")
 
-    summary_md.write_text("\n".join(lines), encoding="utf-8")
+    return buf.getvalue()
 
-    return True, "ok"
+
+def _publish_latest(src: Path, dst: Path) -> None:
+    """Publish ``src`` under data/latest without copying its bytes.
+
+    Both directories live on the same filesystem, so a hard link moves zero
+    payload bytes; os.replace makes the swap atomic for concurrent readers.
+    Cross-device setups (or filesystems without hard links) fall back to a
+    plain copy.
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+        os.replace(tmp, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
 def _update_latest(daily_dir: Path) -> None:
@@ -419,18 +545,23 @@ def _update_latest(daily_dir: Path) -> None:
             payload, _error = _read_json_for_latest(path)
             if payload is None or payload.get("status") == "error" or payload.get("data_status") == "error":
                 continue
-        shutil.copy2(path, latest_dir / path.name)
+        _publish_latest(path, latest_dir / path.name)
 
 
 def _read_json_for_latest(path: Path) -> tuple[Dict[str, Any] | None, str | None]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+        payload = orjson.loads(data) if orjson is not None else json.loads(data)
     except (OSError, json.JSONDecodeError) as exc:
         return None, str(exc)
     return (payload, None) if isinstance(payload, dict) else (None, "non-object JSON")
 
 
 def _has_complete_daily_outputs(daily_dir: Path) -> bool:
+    # summary.md is the last file the meta step writes, so one stat settles
+    # the common partially-populated case without listing the directory.
+    if not (daily_dir / "summary.md").exists():
+        return False
     expected_files = {f"{observer}.json" for observer in OBSERVERS}
     required_files = expected_files | {"summary.json", "summary.md"}
     present_files = {path.name for path in daily_dir.glob("*") if path.is_file()}
@@ -440,32 +571,54 @@ def _has_complete_daily_outputs(daily_dir: Path) -> bool:
 def main() -> None:
     logger = _logger()
     args = _parse_args()
+    root = _repo_root()
     if args.date:
         date_str = args.date
-        daily_dir = _repo_root() / "data" / "daily" / date_str
+        daily_dir = root / "data" / "daily" / date_str
         daily_dir.mkdir(parents=True, exist_ok=True)
     else:
         date_str = _current_date_utc()
-        daily_dir = _repo_root() / "data" / "daily" / date_str
+        daily_dir = root / "data" / "daily" / date_str
         if daily_dir.exists() and _has_complete_daily_outputs(daily_dir):
             return
         daily_dir.mkdir(parents=True, exist_ok=True)
 
     failures: List[str] = []
 
-    for observer in OBSERVERS:
+    # The observers are independent network-bound subprocesses, so fan them
+    # out over a thread pool: wall clock drops from the sum of observer
+    # runtimes to roughly the slowest one. Each worker thread just blocks in
+    # subprocess.run, so the GIL is not a factor. Observers that publish the
+    # shared data/latest files are kept out of the pool and run one at a
+    # time afterwards, in roster order, so the last writer stays the same
+    # deterministic one the sequential loop produced.
+    concurrent = [observer for observer in OBSERVERS if observer not in LATEST_WRITING_OBSERVERS]
+    serialized = [observer for observer in OBSERVERS if observer in LATEST_WRITING_OBSERVERS]
+    max_workers = min(len(concurrent), (os.cpu_count() or 4) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_run_observer, observer, date_str, daily_dir): observer for observer in concurrent}
+        for future in as_completed(futures):
+            observer = futures[future]
+            ok, detail = future.result()
+            if ok:
+                print(f"[ok] {observer}")
+            else:
+                print(f"[fail] {observer}: {detail}")
+                failures.append(observer)
+    for observer in serialized:
         ok, detail = _run_observer(observer, date_str, daily_dir)
         if ok:
             print(f"[ok] {observer}")
         else:
             print(f"[fail] {observer}: {detail}")
             failures.append(observer)
+    failures.sort()
 
     corrupted = _detect_corrupted_json(daily_dir, logger)
     if corrupted:
         failures.append("corrupted_json")
 
-    meta_ok, meta_detail = _run_meta_observer(date_str, daily_dir)
+    meta_ok, meta_detail, _meta_summary = _run_meta_observer(date_str, daily_dir)
     if meta_ok:
         print(f"[ok] {META_OBSERVER}")
     else:
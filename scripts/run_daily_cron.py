@@ -18,6 +18,11 @@ from typing import Sequence
 
 import fcntl
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 LOG_FILE = REPO_ROOT / "logs" / "cron.log"
 LOCK_FILE = REPO_ROOT / "state" / "daily_run.lock"
@@ -35,6 +40,31 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+class _BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """Rotating file handler that batches writes in a 64 KiB buffer.
+
+    StreamHandler.emit flushes after every record, which defeats stream
+    buffering entirely; this subclass makes that per-record flush a no-op
+    and relies on rotation, close(), and logging's atexit shutdown hook to
+    drain the buffer. stdout keeps its default per-record flush so the cron
+    mail stays live.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16, encoding=self.encoding)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.stream is not None:
+            try:
+                self.stream.flush()
+            except ValueError:
+                pass
+        super().close()
+
+
 def _logger() -> logging.Logger:
     logger = logging.getLogger("run_daily_cron")
     if logger.handlers:
@@ -44,13 +74,16 @@ def _logger() -> logging.Logger:
     logger.setLevel(logging.INFO)
     formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
 
-    file_handler = TimedRotatingFileHandler(
+    file_handler = _BufferedTimedRotatingFileHandler(
         LOG_FILE,
         when="midnight",
         interval=1,
         backupCount=14,
         encoding="utf-8",
         utc=True,
+        # Lazy open: the log fd does not exist yet (and is not inherited)
+        # when the first subprocess is spawned before any record is logged.
+        delay=True,
     )
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
@@ -86,6 +119,11 @@ def _run(args: Sequence[str], *, env: dict[str, str] | None = None) -> subproces
         capture_output=True,
         text=True,
         check=False,
+        # run_daily.py relays every observer's stdout/stderr through this
+        # pipe; a 64 KiB buffer keeps the capture to few large reads.
+        bufsize=1 << 16,
+        close_fds=True,
+        start_new_session=True,
     )
 
 
@@ -99,12 +137,17 @@ def _log_subprocess_result(result: subprocess.CompletedProcess[str], logger: log
 @contextmanager
 def _lock_execution(path: Path):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    # Raw fd: the text-mode wrapper stack was never written through, and
+    # O_CLOEXEC keeps the lock fd out of every spawned observer/git child.
+    fd = os.open(str(path), os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o644)
+    try:
         try:
-            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
         except BlockingIOError:
             raise SystemExit("daily runner already active")
         yield
+    finally:
+        os.close(fd)
 
 
 def _run_python_script(script: Path, extra_args: Sequence[str], logger: logging.Logger, date_str: str | None = None) -> None:
@@ -122,6 +165,18 @@ def _run_python_script(script: Path, extra_args: Sequence[str], logger: logging.
     logger.info("script succeeded: %s", script.name)
 
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    # Same filesystem: a hard link moves zero bytes for multi-MB PNGs and
+    # os.replace publishes atomically; any OSError falls back to a copy.
+    tmp = dst.with_name(dst.name + ".tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+        os.replace(tmp, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def _copy_significance_pngs(date_str: str, logger: logging.Logger) -> list[Path]:
     copied: list[Path] = []
     target_dir = DATA_DAILY_DIR / date_str
@@ -130,9 +185,17 @@ def _copy_significance_pngs(date_str: str, logger: logging.Logger) -> list[Path]
         logger.info("skipping PNG copy: optional directory missing: %s", SIGNIFICANT_DIR)
         return copied
 
-    for png in sorted(SIGNIFICANT_DIR.glob(f"{date_str}-*.png")):
-        destination = target_dir / png.name
-        shutil.copy2(png, destination)
+    # One scandir with plain string prefix/suffix checks; Path objects are
+    # only built for the (few) entries that actually match today's date, not
+    # for weeks of accumulated PNGs.
+    prefix = f"{date_str}-"
+    with os.scandir(SIGNIFICANT_DIR) as entries:
+        matches = sorted(
+            entry.name for entry in entries if entry.name.startswith(prefix) and entry.name.endswith(".png")
+        )
+    for name in matches:
+        destination = target_dir / name
+        _link_or_copy(SIGNIFICANT_DIR / name, destination)
         copied.append(destination)
 
     if copied:
@@ -156,7 +219,8 @@ def _update_latest_summary(date_str: str, logger: logging.Logger) -> None:
     existing: dict[str, object] = {}
     if summary_path.exists():
         try:
-            existing = json.loads(summary_path.read_text(encoding="utf-8"))
+            data = summary_path.read_bytes()
+            existing = orjson.loads(data) if orjson is not None else json.loads(data)
             if not isinstance(existing, dict):
                 existing = {}
         except json.JSONDecodeError:
@@ -166,7 +230,20 @@ def _update_latest_summary(date_str: str, logger: logging.Logger) -> None:
     existing["run_date_utc"] = date_str
     existing["runner"] = "scripts/run_daily_cron.py"
 
-    summary_path.write_text(json.dumps(existing, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        payload = orjson.dumps(existing, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(existing, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    # Single write + fsync into a tmp file, then an atomic rename: a crash
+    # mid-write can no longer truncate the published summary.
+    tmp = summary_path.with_name(summary_path.name + ".tmp")
+    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, summary_path)
     logger.info("updated summary: %s", summary_path)
 
 
@@ -174,13 +251,15 @@ def _git_commit_and_push(date_str: str, logger: logging.Logger) -> None:
     env = _git_env()
     _safe_git_add_all(logger, env)
 
-    diff = _run(["/usr/bin/git", "diff", "--cached", "--quiet"], env=env)
-    _log_subprocess_result(diff, logger, "git diff --cached --quiet")
+    # diff-index plumbing is the cheapest "anything staged?" probe — no
+    # porcelain diff machinery, just index vs HEAD.
+    diff = _run(["/usr/bin/git", "diff-index", "--cached", "--quiet", "HEAD"], env=env)
+    _log_subprocess_result(diff, logger, "git diff-index --cached --quiet HEAD")
     if diff.returncode == 0:
         logger.info("commit outcome: no staged changes, skipping commit and push")
         return
-    if diff.returncode not in (0, 1):
-        raise RuntimeError(diff.stderr.strip() or diff.stdout.strip() or "git diff --cached failed")
+    if diff.returncode != 1:
+        raise RuntimeError(diff.stderr.strip() or diff.stdout.strip() or "git diff-index failed")
 
     message = f"daily update {date_str}"
     commit = _run(["/usr/bin/git", "commit", "-m", message], env=env)
@@ -188,9 +267,10 @@ def _git_commit_and_push(date_str: str, logger: logging.Logger) -> None:
     if commit.returncode != 0:
         raise RuntimeError(commit.stderr.strip() or commit.stdout.strip() or "git commit failed")
 
-    commit_hash = _run(["/usr/bin/git", "rev-parse", "--short", "HEAD"], env=env)
-    if commit_hash.returncode == 0:
-        logger.info("commit outcome: created commit %s", commit_hash.stdout.strip())
+    # git commit already names the new commit on stdout, so skip the extra
+    # rev-parse subprocess.
+    first_line = commit.stdout.strip().splitlines()[0] if commit.stdout.strip() else message
+    logger.info("commit outcome: %s", first_line)
 
     push = _run(["/usr/bin/git", "push", "origin", "HEAD"], env=env)
     _log_subprocess_result(push, logger, "git push")
@@ -4,28 +4,38 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
 import json
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DAILY_ROOT = REPO_ROOT / "data" / "daily"
 LATEST_CHART = REPO_ROOT / "data" / "latest" / "chart.png"
 
-FORBIDDEN_KEYS = (
-    "ip",
-    "ip_address",
-    "domain",
-    "domain_name",
-    "hostname",
-    "certificate",
-    "cert_pem",
-    "raw_route",
-    "traceroute_raw",
+FORBIDDEN_KEYS = frozenset(
+    {
+        "ip",
+        "ip_address",
+        "domain",
+        "domain_name",
+        "hostname",
+        "certificate",
+        "cert_pem",
+        "raw_route",
+        "traceroute_raw",
+    }
 )
 
 
@@ -35,10 +45,14 @@ def run(cmd: list[str], *, env: dict[str, str] | None = None, check: bool = True
 
 
 def load_run_daily_observers() -> list[str]:
-    namespace: dict[str, object] = {}
-    code = (REPO_ROOT / "scripts" / "run_daily.py").read_text(encoding="utf-8")
-    exec(compile(code, "run_daily.py", "exec"), namespace)
-    observers = namespace.get("OBSERVERS")
+    # Import the runner as a regular module (the same way the tests do)
+    # instead of read + compile + exec of its source: the cached .pyc is
+    # reused and arbitrary new module-level code is no longer exec'd blind.
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    from scripts import run_daily
+
+    observers = getattr(run_daily, "OBSERVERS", None)
     if not isinstance(observers, list):
         raise RuntimeError("Unable to load OBSERVERS from scripts/run_daily.py")
     return [str(x) for x in observers]
@@ -56,10 +70,18 @@ def assert_daily_outputs(run_date: str, observers: list[str]) -> None:
         raise AssertionError(f"Missing daily outputs: {', '.join(missing)}")
 
 
+def _load_payload(path: Path) -> object:
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def assert_json_schema(run_date: str, observers: list[str]) -> None:
     day_dir = DAILY_ROOT / run_date
-    for observer in observers:
-        payload = json.loads((day_dir / f"{observer}.json").read_text(encoding="utf-8"))
+    # Many small files: fan the open+read+parse out over threads, then
+    # validate in a tight loop; ex.map keeps the observer order.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        payloads = list(pool.map(_load_payload, (day_dir / f"{observer}.json" for observer in observers)))
+    for observer, payload in zip(observers, payloads):
         if not isinstance(payload, dict):
             raise AssertionError(f"{observer}: JSON root is not object")
         if payload.get("observer") != observer:
@@ -72,19 +94,49 @@ def assert_json_schema(run_date: str, observers: list[str]) -> None:
             raise AssertionError(f"{observer}: expected date {run_date}")
 
 
+def _assert_no_forbidden_keys(obj: object, filename: str) -> None:
+    # One pass over the parsed structure's keys instead of re-serializing the
+    # payload and substring-scanning it once per forbidden token.
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(key, str) and key.lower() in FORBIDDEN_KEYS:
+                raise AssertionError(f'{filename}: found restricted key token "{key.lower()}"')
+            _assert_no_forbidden_keys(value, filename)
+    elif isinstance(obj, list):
+        for value in obj:
+            _assert_no_forbidden_keys(value, filename)
+
+
 def assert_privacy_keys(run_date: str) -> None:
     day_dir = DAILY_ROOT / run_date
     for path in iter_json_paths(day_dir):
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        text = json.dumps(payload).lower()
-        for key in FORBIDDEN_KEYS:
-            bad_token = f'"{key}"'
-            if bad_token in text:
-                raise AssertionError(f"{path.name}: found restricted key token {bad_token}")
+        _assert_no_forbidden_keys(_load_payload(path), path.name)
+
+
+@functools.lru_cache(maxsize=1)
+def _tls_observer_module():
+    observer_path = REPO_ROOT / "observers" / "tls-fingerprint-change" / "observer.py"
+    spec = importlib.util.spec_from_file_location("tls_fingerprint_change_observer", observer_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_tls_observer_inprocess(env_overrides: dict[str, str]) -> dict:
+    module = _tls_observer_module()
+    saved = {key: os.environ.get(key) for key in env_overrides}
+    os.environ.update(env_overrides)
+    try:
+        return module.run()
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
 
 def verify_png_policy() -> None:
-    observer = REPO_ROOT / "observers" / "tls-fingerprint-change" / "observer.py"
     base_date = date.today() - timedelta(days=2)
     low_date = base_date.isoformat()
     high_date = (base_date + timedelta(days=1)).isoformat()
@@ -92,10 +144,9 @@ def verify_png_policy() -> None:
     if LATEST_CHART.exists():
         LATEST_CHART.unlink()
 
-    env = os.environ.copy()
-    env["WORLD_OBSERVER_DATE_UTC"] = low_date
-    low_result = run([sys.executable, str(observer)], env=env)
-    low_payload = json.loads(low_result.stdout)
+    # The observer reads its env at run() time, so both checks reuse one
+    # in-process import instead of paying interpreter startup twice.
+    low_payload = _run_tls_observer_inprocess({"WORLD_OBSERVER_DATE_UTC": low_date})
 
     low_sig = bool(low_payload.get("significance", {}).get("any_significant", False))
     if low_sig:
@@ -103,10 +154,9 @@ def verify_png_policy() -> None:
     elif LATEST_CHART.exists():
         raise AssertionError("chart.png exists despite non-significant baseline run")
 
-    env_high = os.environ.copy()
-    env_high["WORLD_OBSERVER_DATE_UTC"] = high_date
-    env_high["WORLD_OBSERVER_TLS_FORCE_SIGNIFICANT"] = "1"
-    high_payload = json.loads(run([sys.executable, str(observer)], env=env_high).stdout)
+    high_payload = _run_tls_observer_inprocess(
+        {"WORLD_OBSERVER_DATE_UTC": high_date, "WORLD_OBSERVER_TLS_FORCE_SIGNIFICANT": "1"}
+    )
     high_sig = bool(high_payload.get("significance", {}).get("any_significant", False))
     if not high_sig:
         raise AssertionError("forced significance did not produce a significant payload")
@@ -0,0 +1,27 @@
+"""Shared JSON helpers for tests: orjson when available, stdlib otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+else:
+    # json.loads with no kwargs already reuses the module-level default
+    # decoder, so only the encoder needs hoisting: dumps(ensure_ascii=False)
+    # builds a fresh JSONEncoder on every call.
+    loads = json.loads
+    _encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def dumps_bytes(obj: Any) -> bytes:
+        return _encode(obj).encode("utf-8")
@@ -0,0 +1,16 @@
+"""Repo-root path shared by the test modules.
+
+Importing this resolves the repository root exactly once per pytest session
+(one realpath syscall) and puts it on sys.path, replacing the per-module
+``Path(__file__).resolve().parents[1]`` + ``sys.path.insert`` preamble.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import run_daily
+
+_STUB_OBSERVER_SOURCE = b"print('{}')\n"
+
+
+@pytest.fixture(scope="session")
+def observer_stub_tree(tmp_path_factory) -> Path:
+    """One observers/<name>/observer.py stub tree for the whole session.
+
+    OBSERVERS is static, so tests that only need the tree to exist symlink
+    this directory into their tmp_path instead of rebuilding 36 stub files
+    per test.
+    """
+    root = tmp_path_factory.mktemp("observer-stubs") / "observers"
+    # Two passes — all mkdirs, then all writes — keep the parent dentry hot
+    # in the kernel cache instead of alternating mkdir/creat per observer.
+    root_str = str(root)
+    for observer in run_daily.OBSERVERS:
+        os.makedirs(f"{root_str}/{observer}", exist_ok=True)
+    for observer in run_daily.OBSERVERS:
+        with open(f"{root_str}/{observer}/observer.py", "wb") as handle:
+            handle.write(_STUB_OBSERVER_SOURCE)
+    return root
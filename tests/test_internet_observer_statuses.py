@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import functools
 import importlib.util
-import json
 from pathlib import Path
 
 from scripts import run_daily
+from tests._json import dumps_bytes, loads
 from scripts import export_dashboard
 
 
+@functools.lru_cache(maxsize=None)
 def _load_observer(path: str):
+    # One exec per observer path for the whole session; repeat calls hit the
+    # cache the way a sys.modules import would.
     spec = importlib.util.spec_from_file_location(Path(path).parent.name.replace('-', '_'), path)
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
@@ -27,7 +31,7 @@ def test_asn_observer_internal_budget_returns_json_not_runner_timeout(tmp_path,
 
     assert ok is True
     assert detail == "ok"
-    payload = json.loads((daily_dir / "asn-visibility-by-country.json").read_text(encoding="utf-8"))
+    payload = loads((daily_dir / "asn-visibility-by-country.json").read_bytes())
     assert payload["observer"] == "asn-visibility-by-country"
     assert payload["status"] == "partial"
     assert payload["data_status"] == "unavailable"
@@ -60,10 +64,10 @@ def test_dashboard_export_uses_countries_evaluated_for_ipv6_and_excludes_planned
         "ipv6-locked-states": {"observer": "ipv6-locked-states", "data_status": "ok", "summary_stats": {"countries_evaluated": 3, "significant_count": 0}},
     }
     for observer, payload in payloads.items():
-        (latest_dir / f"{observer}.json").write_text(json.dumps(payload), encoding="utf-8")
+        (latest_dir / f"{observer}.json").write_bytes(dumps_bytes(payload))
 
     export_dashboard.export_dashboard(latest_dir, dashboard_dir)
-    internet = json.loads((dashboard_dir / "internet.json").read_text(encoding="utf-8"))
+    internet = loads((dashboard_dir / "internet.json").read_bytes())
     cards = {card["observer"]: card for card in internet["observers"]}
 
     assert "asn-visibility-by-country" not in cards
@@ -99,10 +103,10 @@ def test_dashboard_export_normalizes_ipv6_global_evaluated_unavailable_to_partia
         "data_status": "unavailable",
         "summary_stats": {"countries_evaluated": 3, "significant_count": 1},
     }
-    (latest_dir / "ipv6-global-compare.json").write_text(json.dumps(payload), encoding="utf-8")
+    (latest_dir / "ipv6-global-compare.json").write_bytes(dumps_bytes(payload))
 
     export_dashboard.export_dashboard(latest_dir, dashboard_dir)
-    internet = json.loads((dashboard_dir / "internet.json").read_text(encoding="utf-8"))
+    internet = loads((dashboard_dir / "internet.json").read_bytes())
     card = next(card for card in internet["observers"] if card["observer"] == "ipv6-global-compare")
 
     assert card["status"] == "ok"
@@ -130,10 +134,10 @@ def test_dashboard_export_uses_ipv6_locked_count_for_empty_global_compare(tmp_pa
         },
     }
     for observer, payload in payloads.items():
-        (latest_dir / f"{observer}.json").write_text(json.dumps(payload), encoding="utf-8")
+        (latest_dir / f"{observer}.json").write_bytes(dumps_bytes(payload))
 
     export_dashboard.export_dashboard(latest_dir, dashboard_dir)
-    internet = json.loads((dashboard_dir / "internet.json").read_text(encoding="utf-8"))
+    internet = loads((dashboard_dir / "internet.json").read_bytes())
     card = next(card for card in internet["observers"] if card["observer"] == "ipv6-global-compare")
 
     assert card["status"] == "ok"
@@ -152,10 +156,10 @@ def test_dashboard_export_normalizes_ipv6_locked_evaluated_unavailable_to_ok(tmp
         "data_status": "unavailable",
         "summary_stats": {"countries_evaluated": 3, "significant_count": 0},
     }
-    (latest_dir / "ipv6-locked-states.json").write_text(json.dumps(payload), encoding="utf-8")
+    (latest_dir / "ipv6-locked-states.json").write_bytes(dumps_bytes(payload))
 
     export_dashboard.export_dashboard(latest_dir, dashboard_dir)
-    internet = json.loads((dashboard_dir / "internet.json").read_text(encoding="utf-8"))
+    internet = loads((dashboard_dir / "internet.json").read_bytes())
     card = next(card for card in internet["observers"] if card["observer"] == "ipv6-locked-states")
 
     assert card["status"] == "ok"
@@ -175,9 +179,9 @@ def test_dashboard_export_asn_no_data_is_not_active_internet_card(tmp_path) -> N
         "data_status": "unavailable",
         "summary_stats": {"countries_evaluated": 0, "significant_count": 0},
     }
-    (latest_dir / "asn-visibility-by-country.json").write_text(json.dumps(payload), encoding="utf-8")
+    (latest_dir / "asn-visibility-by-country.json").write_bytes(dumps_bytes(payload))
 
     export_dashboard.export_dashboard(latest_dir, dashboard_dir)
-    internet = json.loads((dashboard_dir / "internet.json").read_text(encoding="utf-8"))
+    internet = loads((dashboard_dir / "internet.json").read_bytes())
 
     assert all(card["observer"] != "asn-visibility-by-country" for card in internet["observers"])
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import functools
 import importlib.util
 import json
 import subprocess
 import sys
-from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+from tests._paths import REPO_ROOT
+
 OBSERVER_PATH = REPO_ROOT / "observers" / "media-language-germany" / "observer.py"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_observer():
+    # One exec of the observer module per session; monkeypatch restores any
+    # attribute the tests patch on it, so the cached module is safe to share.
     spec = importlib.util.spec_from_file_location("media_language_germany_observer", OBSERVER_PATH)
     module = importlib.util.module_from_spec(spec)
     assert spec.loader is not None
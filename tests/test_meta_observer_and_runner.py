@@ -1,70 +1,127 @@
 from __future__ import annotations
 
-import json
-import sys
+import functools
+import importlib.util
+import os
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+import pytest
+
+from tests._paths import REPO_ROOT
 
 from scripts import run_daily
 from scripts import run_daily_cron
+from tests._json import dumps_bytes, loads
 
 
 def _write_observer_payload(daily_dir: Path, observer: str, payload: object) -> None:
-    (daily_dir / f"{observer}.json").write_text(json.dumps(payload), encoding="utf-8")
+    (daily_dir / f"{observer}.json").write_bytes(dumps_bytes(payload))
+
+
+# Observer names are [a-z0-9-]+ (enforced by the name-consistency test), so a
+# byte-level substitution needs no JSON escaping and skips the encoder for the
+# near-identical per-observer payloads; nested payloads still go through
+# _write_observer_payload.
+_VALUE_PAYLOAD_TEMPLATE = b'{"observer": "__NAME__", "value": 1}'
+_OK_PAYLOAD_TEMPLATE = b'{"observer": "__NAME__", "status": "ok"}'
+
+
+def _write_templated_payload(daily_root: str, observer: str, template: bytes) -> None:
+    # Callers hoist str(daily_dir) once; a plain string join skips the
+    # per-iteration PurePath construction in the OBSERVERS-sized loops.
+    with open(f"{daily_root}/{observer}.json", "wb") as handle:
+        handle.write(template.replace(b"__NAME__", observer.encode("ascii")))
+
+
+@functools.lru_cache(maxsize=1)
+def _meta_observer_module():
+    spec = importlib.util.spec_from_file_location(
+        "world_observer_meta_observer",
+        REPO_ROOT / "observers" / "world-observer-meta" / "observer.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def meta_observer_inprocess(monkeypatch):
+    """Route _run_meta_observer through the imported meta module.
+
+    Spawning a fresh interpreter per test costs far more than the aggregation
+    itself; this fake applies the env the runner would pass to the child and
+    calls run() in-process, so the tests still exercise the real aggregation
+    and summary-writing paths.
+    """
+    module = _meta_observer_module()
+
+    class _CompletedProcess:
+        returncode = 0
+        stderr = ""
+
+        def __init__(self, stdout: str) -> None:
+            self.stdout = stdout
+
+    def _fake_run(args, **kwargs):
+        env = kwargs.get("env") or {}
+        for key in ("WORLD_OBSERVER_DAILY_DIR", "WORLD_OBSERVER_DATE_UTC"):
+            if key in env:
+                monkeypatch.setenv(key, env[key])
+            else:
+                monkeypatch.delenv(key, raising=False)
+        return _CompletedProcess(dumps_bytes(module.run()).decode("utf-8"))
+
+    monkeypatch.setattr(run_daily.subprocess, "run", _fake_run)
 
 
-def test_run_meta_observer_good_case(tmp_path, monkeypatch) -> None:
+def test_run_meta_observer_good_case(tmp_path, monkeypatch, observer_stub_tree, meta_observer_inprocess) -> None:
     date_str = "2099-01-01"
     daily_dir = tmp_path / "data" / "daily" / date_str
     daily_dir.mkdir(parents=True)
-    observers_dir = tmp_path / "observers"
-    observers_dir.mkdir(parents=True)
+    os.symlink(observer_stub_tree, tmp_path / "observers")
 
+    daily_root = str(daily_dir)
     for observer in run_daily.OBSERVERS:
-        (observers_dir / observer).mkdir(parents=True)
-        (observers_dir / observer / "observer.py").write_text("print('{}')\n", encoding="utf-8")
-        _write_observer_payload(daily_dir, observer, {"observer": observer, "value": 1})
+        _write_templated_payload(daily_root, observer, _VALUE_PAYLOAD_TEMPLATE)
 
     monkeypatch.setattr(run_daily, "_repo_root", lambda: Path.cwd())
 
-    ok, detail = run_daily._run_meta_observer(date_str, daily_dir)
+    ok, detail, summary = run_daily._run_meta_observer(date_str, daily_dir)
     assert ok is True
     assert detail == "ok"
 
-    summary = json.loads((daily_dir / "summary.json").read_text(encoding="utf-8"))
-    assert summary["observers_run"] == sorted(run_daily.OBSERVERS)
+    assert summary is not None
+    assert summary["observers_run"] == list(run_daily.OBSERVERS_SORTED)
     assert summary["observers_missing"] == []
+    # The returned dict must match what was persisted; only this test pays
+    # the on-disk round trip.
+    assert loads((daily_dir / "summary.json").read_bytes()) == summary
 
 
-def test_run_meta_observer_missing_and_invalid(tmp_path, monkeypatch) -> None:
+def test_run_meta_observer_missing_and_invalid(tmp_path, monkeypatch, observer_stub_tree, meta_observer_inprocess) -> None:
     date_str = "2099-01-02"
     daily_dir = tmp_path / "data" / "daily" / date_str
     daily_dir.mkdir(parents=True)
-    observers_dir = tmp_path / "observers"
-    observers_dir.mkdir(parents=True)
+    os.symlink(observer_stub_tree, tmp_path / "observers")
 
-    observers = sorted(run_daily.OBSERVERS)
+    observers = run_daily.OBSERVERS_SORTED
     missing_observer = observers[0]
     invalid_observer = observers[1]
-    for observer in observers:
-        (observers_dir / observer).mkdir(parents=True)
-        (observers_dir / observer / "observer.py").write_text("print('{}')\n", encoding="utf-8")
 
+    daily_root = str(daily_dir)
     for observer in observers[2:]:
-        _write_observer_payload(daily_dir, observer, {"observer": observer, "status": "ok"})
+        _write_templated_payload(daily_root, observer, _OK_PAYLOAD_TEMPLATE)
 
     # exists but invalid root (list) -> should count as missing
     _write_observer_payload(daily_dir, invalid_observer, [{"bad": True}])
 
     monkeypatch.setattr(run_daily, "_repo_root", lambda: Path.cwd())
 
-    ok, detail = run_daily._run_meta_observer(date_str, daily_dir)
+    ok, detail, summary = run_daily._run_meta_observer(date_str, daily_dir)
     assert ok is True
     assert detail == "ok"
 
-    summary = json.loads((daily_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary is not None
     assert missing_observer in summary["observers_missing"]
     assert invalid_observer in summary["observers_missing"]
     assert missing_observer not in summary["observers_run"]
@@ -88,9 +145,10 @@ def test_run_meta_observer_rejects_invalid_meta_stdout(tmp_path, monkeypatch) ->
     monkeypatch.setattr(run_daily, "_repo_root", lambda: Path.cwd())
     monkeypatch.setattr(run_daily.subprocess, "run", _fake_run)
 
-    ok, detail = run_daily._run_meta_observer(date_str, daily_dir)
+    ok, detail, summary = run_daily._run_meta_observer(date_str, daily_dir)
     assert ok is False
     assert detail == "invalid JSON"
+    assert summary is None
     assert not (daily_dir / "summary.json").exists()
 
 
@@ -101,10 +159,10 @@ def test_run_observer_timeout_writes_structured_error_and_can_continue(tmp_path,
     observers_root = tmp_path / "observers"
     hanging_dir = observers_root / "hanging-observer"
     hanging_dir.mkdir(parents=True)
-    (hanging_dir / "observer.py").write_text("import time; time.sleep(999)\n", encoding="utf-8")
+    (hanging_dir / "observer.py").write_bytes(b"import time; time.sleep(999)\n")
     ok_dir = observers_root / "ok-observer"
     ok_dir.mkdir(parents=True)
-    (ok_dir / "observer.py").write_text("print('{}')\n", encoding="utf-8")
+    (ok_dir / "observer.py").write_bytes(b"print('{}')\n")
 
     calls = []
 
@@ -126,7 +184,7 @@ def test_run_observer_timeout_writes_structured_error_and_can_continue(tmp_path,
     ok, detail = run_daily._run_observer("hanging-observer", date_str, daily_dir)
     assert ok is False
     assert detail == "timeout 3s"
-    payload = json.loads((daily_dir / "hanging-observer.json").read_text(encoding="utf-8"))
+    payload = loads((daily_dir / "hanging-observer.json").read_bytes())
     assert payload["status"] == "error"
     assert payload["data_status"] == "error"
     assert payload["diagnostics"]["timeout"] is True
@@ -135,7 +193,7 @@ def test_run_observer_timeout_writes_structured_error_and_can_continue(tmp_path,
     ok, detail = run_daily._run_observer("ok-observer", date_str, daily_dir)
     assert ok is True
     assert detail == "ok"
-    assert json.loads((daily_dir / "ok-observer.json").read_text(encoding="utf-8"))["observer"] == "ok-observer"
+    assert loads((daily_dir / "ok-observer.json").read_bytes())["observer"] == "ok-observer"
     assert calls[0][1]["timeout"] == 3.0
     assert calls[1][1]["timeout"] == 3.0
 
@@ -147,9 +205,8 @@ def test_run_observer_overrides_stale_world_observer_date_env(tmp_path, monkeypa
     daily_dir.mkdir(parents=True)
     observer_dir = tmp_path / "observers" / "date-echo"
     observer_dir.mkdir(parents=True)
-    observer_dir.joinpath("observer.py").write_text(
-        "import json, os; print(json.dumps({'observer': 'date-echo', 'date_utc': os.environ['WORLD_OBSERVER_DATE_UTC']}))\n",
-        encoding="utf-8",
+    observer_dir.joinpath("observer.py").write_bytes(
+        b"import json, os; print(json.dumps({'observer': 'date-echo', 'date_utc': os.environ['WORLD_OBSERVER_DATE_UTC']}))\n"
     )
 
     monkeypatch.setattr(run_daily, "_repo_root", lambda: tmp_path)
@@ -159,7 +216,7 @@ def test_run_observer_overrides_stale_world_observer_date_env(tmp_path, monkeypa
 
     assert ok is True
     assert detail == "ok"
-    payload = json.loads((daily_dir / "date-echo.json").read_text(encoding="utf-8"))
+    payload = loads((daily_dir / "date-echo.json").read_bytes())
     assert payload["date_utc"] == date_str
 
 
@@ -206,7 +263,7 @@ def test_update_latest_exports_newest_valid_fuel_state_not_older_unavailable_dai
 
     run_daily._update_latest(daily_dir)
 
-    latest = json.loads((tmp_path / "data" / "latest" / f"{run_daily.FUEL_OBSERVER}.json").read_text(encoding="utf-8"))
+    latest = loads((tmp_path / "data" / "latest" / f"{run_daily.FUEL_OBSERVER}.json").read_bytes())
     assert latest["date"] == "2026-07-02"
     assert latest["status"] == "ok"
     assert latest["fuels"]["benzin"]["current_price"] == 1.98
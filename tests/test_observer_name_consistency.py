@@ -1,32 +1,39 @@
 from __future__ import annotations
 
+import os
 import re
-import sys
-from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+from tests._paths import REPO_ROOT  # noqa: F401 - side effect: repo root on sys.path
 
 from scripts.run_daily import ALL_OBSERVERS, OBSERVERS
 
+# Compiled once at import; matching the newline-joined roster in a single
+# fullmatch keeps the whole validation inside one C-level regex traversal
+# instead of a Python-level call per observer name.
+_NAME_PATTERN = r"[a-z0-9]+(?:-[a-z0-9]+)*"
+_NAMES_RE = re.compile(rf"{_NAME_PATTERN}(?:\n{_NAME_PATTERN})*")
 
-def _observer_dirs_with_entrypoints() -> set[str]:
-    observers_dir = Path("observers")
-    return {
-        path.name
-        for path in observers_dir.iterdir()
-        if path.is_dir() and path.name != "world-observer-meta" and (path / "observer.py").exists()
-    }
 
+def _observer_dirs_with_entrypoints() -> list[str]:
+    # scandir reuses the d_type the directory read already produced, so the
+    # is_dir check is stat-free; only candidate dirs pay the entrypoint stat.
+    with os.scandir("observers") as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name != "world-observer-meta"
+            and entry.is_dir(follow_symlinks=False)
+            and os.path.exists(os.path.join(entry.path, "observer.py"))
+        )
 
-def test_observer_name_consistency() -> None:
-    observed = _observer_dirs_with_entrypoints()
-    configured = set(ALL_OBSERVERS)
 
-    assert observed == configured
+def test_observer_name_consistency() -> None:
+    # ALL_OBSERVERS is sorted at import, so a direct list comparison avoids
+    # building two hash sets and gives pytest an ordered diff on failure.
+    assert _observer_dirs_with_entrypoints() == ALL_OBSERVERS
 
 
 def test_observer_names_are_valid_unique_and_sorted() -> None:
     assert OBSERVERS == sorted(OBSERVERS)
     assert len(OBSERVERS) == len(set(OBSERVERS))
-    assert all(re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", name) for name in OBSERVERS)
+    assert _NAMES_RE.fullmatch("\n".join(OBSERVERS)) is not None
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
+import functools
 import importlib.util
-from pathlib import Path
-import sys
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT))
+from tests._paths import REPO_ROOT
+
 OBSERVER_PATH = REPO_ROOT / "observers" / "wiesmoor-sky-observer" / "observer.py"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_observer():
     spec = importlib.util.spec_from_file_location("wiesmoor_sky_observer", OBSERVER_PATH)
     module = importlib.util.module_from_spec(spec)
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
+import functools
 import importlib.util
-import json
-from pathlib import Path
 from typing import Any
-import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tests._paths import REPO_ROOT
 
 from scripts import run_daily
 from scripts.export_dashboard import _internet_status_fields
+from tests._json import dumps_bytes
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
 OBSERVER_PATH = REPO_ROOT / "observers" / "wiesmoor-weather" / "observer.py"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_observer():
+    # One exec of the observer module per session; monkeypatch restores any
+    # attribute the tests patch on it, so the cached module is safe to share.
     spec = importlib.util.spec_from_file_location("wiesmoor_weather_observer", OBSERVER_PATH)
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
@@ -41,7 +42,7 @@ def test_temporary_503_preserves_last_successful_weather_data(tmp_path, monkeypa
     monkeypatch.setattr(observer, "_fetch_json", lambda _url: (_api_payload(18.5), {"url": _url, "status": "ok", "api_attempts": 1, "retries": 0, "http_status": 200, "attempts": [{"attempt": 1, "http_status": 200, "ok": True, "error": None}]}))
 
     successful = observer.build_payload()
-    latest.write_text(json.dumps(successful), encoding="utf-8")
+    latest.write_bytes(dumps_bytes(successful))
 
     failure_diag = {"url": "https://example.invalid", "status": "unavailable", "temporary_failure": True, "failed_at_utc": "2026-07-08T11:00:00Z", "api_attempts": 3, "retries": 2, "http_status": 503, "attempts": [{"attempt": 1, "http_status": 503, "ok": False, "error": "HTTP 503"}, {"attempt": 2, "http_status": 503, "ok": False, "error": "HTTP 503"}, {"attempt": 3, "http_status": 503, "ok": False, "error": "HTTP 503"}]}
     monkeypatch.setenv("WORLD_OBSERVER_DATE_UTC", "2026-07-09")
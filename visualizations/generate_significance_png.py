@@ -8,14 +8,26 @@ then emits at most one conservative, historically oriented alert image.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised in minimal CI images
+    orjson = None  # type: ignore
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DAILY_DIR = REPO_ROOT / "data" / "daily"
@@ -24,7 +36,9 @@ STATE_PATH = REPO_ROOT / "visualizations" / "significant_state.json"
 SUMMARY_FILENAME = "summary.json"
 
 
-@dataclass
+# slots drops the per-instance __dict__ (faster attribute access, smaller
+# events); frozen documents that events are immutable once built.
+@dataclass(slots=True, frozen=True)
 class SignificanceEvent:
     observer: str
     title: str
@@ -51,13 +65,29 @@ PRIORITY_ORDER = [
     "world-observer-meta",
 ]
 
+# Built once: _select_event would otherwise rebuild this dict per call.
+_PRIORITY_MAP: Dict[str, int] = {name: index for index, name in enumerate(PRIORITY_ORDER)}
+
+# The observer universe is fixed, so the meta rule can walk this presorted
+# roster with membership tests instead of sorting per call.
+_OBSERVER_NAMES_SORTED: Tuple[str, ...] = tuple(sorted(PRIORITY_ORDER))
+
 
 def _today_utc() -> str:
     return datetime.now(timezone.utc).date().isoformat()
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_date(date_str: str) -> date:
-    return datetime.strptime(date_str, "%Y-%m-%d").date()
+    # The same handful of strings (today, yesterday, stored baseline dates)
+    # is re-parsed across the evaluation branches; a cache hit beats running
+    # any parser at all. On a miss, fromisoformat is a C fast path for the
+    # YYYY-MM-DD strings the state file uses; strptime remains as fallback
+    # for anything the stricter parser rejects (e.g. unpadded months).
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
 def _coerce_date(date_value: Optional[str]) -> str:
@@ -70,9 +100,29 @@ def _coerce_date(date_value: Optional[str]) -> str:
     return parsed.date().isoformat()
 
 
+# Below one page of payload the mmap setup costs more than it saves; larger
+# files are parsed straight out of the page cache without a bytes copy.
+_MMAP_MIN_SIZE = 4096
+
+
 def _load_json(path: Path) -> Optional[Dict[str, Any]]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        # Parse the raw bytes directly: orjson fuses UTF-8 validation with the
+        # decode and skips the intermediate str read_text would build. Large
+        # files are memory-mapped so the parser reads the page cache in place.
+        if orjson is not None:
+            fd = os.open(str(path), os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size >= _MMAP_MIN_SIZE:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as buffer:
+                        payload = orjson.loads(memoryview(buffer))
+                else:
+                    payload = orjson.loads(os.read(fd, size))
+            finally:
+                os.close(fd)
+        else:
+            payload = json.loads(path.read_bytes())
     except (OSError, json.JSONDecodeError):
         return None
     if not isinstance(payload, dict):
@@ -81,18 +131,26 @@ def _load_json(path: Path) -> Optional[Dict[str, Any]]:
 
 
 def _collect_observations(daily_dir: Path) -> Dict[str, Dict[str, Any]]:
+    # The result is keyed by observer name, so directory order is irrelevant:
+    # scandir filters on the name alone without building Path objects (or a
+    # sorted list) for entries that are skipped anyway.
     observations: Dict[str, Dict[str, Any]] = {}
-    if not daily_dir.exists():
+    try:
+        entries = os.scandir(daily_dir)
+    except OSError:
         return observations
-    for path in sorted(daily_dir.iterdir()):
-        if path.suffix != ".json" or path.name == SUMMARY_FILENAME:
-            continue
-        payload = _load_json(path)
-        if not payload:
-            continue
-        observer_name = payload.get("observer")
-        if isinstance(observer_name, str) and observer_name:
-            observations[observer_name] = payload
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or entry.name == SUMMARY_FILENAME:
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            payload = _load_json(Path(entry.path))
+            if not payload:
+                continue
+            observer_name = payload.get("observer")
+            if isinstance(observer_name, str) and observer_name:
+                observations[observer_name] = payload
     return observations
 
 
@@ -106,55 +164,107 @@ def _load_state() -> Dict[str, Any]:
 def _save_state(state: Dict[str, Any]) -> None:
     _ensure_state_comments(state)
     STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    STATE_PATH.write_text(json.dumps(state, ensure_ascii=False, indent=2) + "\n")
+    # Sorted keys make repeated runs byte-identical regardless of dict build
+    # order, so the skip-if-unchanged comparison below hits reliably.
+    if orjson is not None:
+        data = orjson.dumps(
+            state,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SORT_KEYS,
+        )
+    else:
+        data = (json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode(
+            "utf-8"
+        )
+    # State is often unchanged across reruns of the same day; skip the write
+    # (and the resulting git diff) when the bytes match, and publish changes
+    # via tmp + os.replace so a crash cannot truncate the state file.
+    try:
+        if STATE_PATH.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    tmp = STATE_PATH.with_name(STATE_PATH.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, STATE_PATH)
+
+
+_DNS_FAILED_STATUSES = frozenset({"timeout", "error"})
+# Interned so comparisons against parser-interned status strings hit the
+# pointer-equality fast path before falling back to a character compare.
+_DNS_ANSWERED = sys.intern("answer")
 
 
 def _nk_is_silent(payload: Dict[str, Any]) -> bool:
     # Rule: treat silence as all targets failing ping, TCP 443, and DNS (timeout/error).
+    # Checks are ordered cheapest-first so a passing ping (or TCP handshake)
+    # disqualifies the target before the nested dns subtree is ever touched.
     targets = payload.get("targets")
     if not isinstance(targets, list) or not targets:
         return False
     for target in targets:
         if not isinstance(target, dict):
             return False
-        ping_ok = target.get("ping", {}).get("ok")
-        tcp_ok = target.get("tcp_443", {}).get("ok")
-        dns_a = target.get("dns", {}).get("a", {}).get("status")
-        dns_aaaa = target.get("dns", {}).get("aaaa", {}).get("status")
-        dns_failed = dns_a in {"timeout", "error"} and dns_aaaa in {"timeout", "error"}
-        if not (ping_ok is False and tcp_ok is False and dns_failed):
+        if target.get("ping", {}).get("ok") is not False:
+            return False
+        if target.get("tcp_443", {}).get("ok") is not False:
+            return False
+        dns = target.get("dns") or {}
+        if dns.get("a", {}).get("status") not in _DNS_FAILED_STATUSES:
+            return False
+        if dns.get("aaaa", {}).get("status") not in _DNS_FAILED_STATUSES:
             return False
     return True
 
 
 def _nk_any_success(payload: Dict[str, Any]) -> bool:
     # Rule: any successful ping, TCP handshake, or DNS answer counts as a response.
+    # Same cheapest-first ordering: a healthy target returns on the ping probe
+    # without walking the dns subtree at all.
     targets = payload.get("targets")
     if not isinstance(targets, list) or not targets:
         return False
     for target in targets:
         if not isinstance(target, dict):
             continue
-        ping_ok = target.get("ping", {}).get("ok")
-        tcp_ok = target.get("tcp_443", {}).get("ok")
-        dns_a = target.get("dns", {}).get("a", {}).get("status")
-        dns_aaaa = target.get("dns", {}).get("aaaa", {}).get("status")
-        if ping_ok is True or tcp_ok is True or dns_a == "answer" or dns_aaaa == "answer":
+        if target.get("ping", {}).get("ok") is True:
+            return True
+        if target.get("tcp_443", {}).get("ok") is True:
+            return True
+        dns = target.get("dns") or {}
+        if dns.get("a", {}).get("status") == _DNS_ANSWERED or dns.get("aaaa", {}).get("status") == _DNS_ANSWERED:
             return True
     return False
 
 
+# One compiled alternation replaces the lower/startswith/split/isdigit string
+# surgery this helper used to do per candidate (including every hop in
+# response_path): AS number, dotted quad, or colon-separated with no empty part.
+_IP_ASN_RE = re.compile(r"[Aa][Ss]\d+|\d+(?:\.\d+){3}|[^:]+(?::[^:]+)+")
+
+
 def _looks_like_ip_or_asn(value: str) -> bool:
     if not value:
         return False
-    if value.lower().startswith("as") and value[2:].isdigit():
-        return True
-    if ":" in value and all(part for part in value.split(":")):
-        return True
-    parts = value.split(".")
-    if len(parts) == 4 and all(part.isdigit() for part in parts):
-        return True
-    return False
+    return _IP_ASN_RE.fullmatch(value) is not None
+
+
+# Token tables and category strings built once at import: these helpers fire
+# per target/hop, and interned categories make the membership checks in
+# _map_response_path pointer comparisons.
+_DOMESTIC_TOKENS = ("domestic", "internal", "local")
+_TRANSIT_TOKENS = ("international", "transit", "external")
+_NORTH_KOREA_VALUES = frozenset(
+    {
+        "kp",
+        "prk",
+        "north korea",
+        "democratic people's republic of korea",
+        "democratic peoples republic of korea",
+    }
+)
+_DOMESTIC_NETWORK = sys.intern("domestic_network")
+_INTERNATIONAL_TRANSIT = sys.intern("international_transit")
+_UNKNOWN = sys.intern("unknown")
 
 
 def _map_origin_context(value: str) -> Optional[str]:
@@ -163,12 +273,12 @@ def _map_origin_context(value: str) -> Optional[str]:
     if _looks_like_ip_or_asn(value):
         return None
     normalized = value.lower()
-    if "domestic" in normalized or "internal" in normalized or "local" in normalized:
-        return "domestic_network"
-    if "international" in normalized or "transit" in normalized or "external" in normalized:
-        return "international_transit"
+    if any(token in normalized for token in _DOMESTIC_TOKENS):
+        return _DOMESTIC_NETWORK
+    if any(token in normalized for token in _TRANSIT_TOKENS):
+        return _INTERNATIONAL_TRANSIT
     if "unknown" in normalized:
-        return "unknown"
+        return _UNKNOWN
     return None
 
 
@@ -178,36 +288,34 @@ def _map_country_hint(value: str) -> Optional[str]:
     if _looks_like_ip_or_asn(value):
         return None
     normalized = value.strip().lower()
-    north_korea_values = {
-        "kp",
-        "prk",
-        "north korea",
-        "democratic people's republic of korea",
-        "democratic peoples republic of korea",
-    }
-    if normalized in north_korea_values:
-        return "domestic_network"
-    return "international_transit"
+    if normalized in _NORTH_KOREA_VALUES:
+        return _DOMESTIC_NETWORK
+    return _INTERNATIONAL_TRANSIT
 
 
 def _map_response_path(value: Any) -> Optional[str]:
     if isinstance(value, list):
-        countries: List[str] = []
+        # Single streaming pass instead of building the countries, mapped,
+        # and filtered lists: return on the first international hit and
+        # otherwise just remember whether any hop mapped at all.
+        seen_domestic = False
         for hop in value:
             if isinstance(hop, dict):
                 for key in ("country", "country_code", "asn_country"):
                     hop_value = hop.get(key)
                     if isinstance(hop_value, str):
-                        countries.append(hop_value)
+                        mapped = _map_country_hint(hop_value)
+                        if mapped is _INTERNATIONAL_TRANSIT:
+                            return _INTERNATIONAL_TRANSIT
+                        if mapped:
+                            seen_domestic = True
             elif isinstance(hop, str):
-                countries.append(hop)
-        mapped = [_map_country_hint(country) for country in countries]
-        mapped = [item for item in mapped if item]
-        if not mapped:
-            return None
-        if "international_transit" in mapped:
-            return "international_transit"
-        return "domestic_network"
+                mapped = _map_country_hint(hop)
+                if mapped is _INTERNATIONAL_TRANSIT:
+                    return _INTERNATIONAL_TRANSIT
+                if mapped:
+                    seen_domestic = True
+        return _DOMESTIC_NETWORK if seen_domestic else None
     if isinstance(value, str):
         return _map_origin_context(value)
     return None
@@ -357,21 +465,28 @@ def _area51_flight_event(payload: Dict[str, Any]) -> Optional[SignificanceEvent]
     )
 
 
-def _traceroute_targets(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    targets = payload.get("targets")
-    if not isinstance(targets, list):
+def _index_by(entries: Any, key: str, fallback: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    # One generic name->entry indexer shared by the traceroute, country, and
+    # MX payload shapes; the loop body stays small enough for the bytecode
+    # cache and changes to the skip rules land in one place.
+    if not isinstance(entries, list):
         return {}
-    result = {}
-    for target in targets:
-        if not isinstance(target, dict):
-            continue
-        key = str(target.get("name") or target.get("host") or "")
-        if not key:
+    result: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
             continue
-        result[key] = target
+        value = entry.get(key)
+        if not value and fallback is not None:
+            value = entry.get(fallback)
+        if isinstance(value, str) and value:
+            result[value] = entry
     return result
 
 
+def _traceroute_targets(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return _index_by(payload.get("targets"), "name", fallback="host")
+
+
 def _shrinkage_index(payload: Dict[str, Any]) -> Optional[float]:
     index = payload.get("index")
     if isinstance(index, (int, float)):
@@ -386,32 +501,11 @@ def _silent_countries_count(payload: Dict[str, Any]) -> Optional[int]:
     return None
 
 
-def _asn_countries(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    countries = payload.get("countries")
-    if not isinstance(countries, list):
-        return {}
-    result = {}
-    for entry in countries:
-        if not isinstance(entry, dict):
-            continue
-        country = entry.get("country")
-        if isinstance(country, str) and country:
-            result[country] = entry
-    return result
-
-
-def _ipv6_countries(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    countries = payload.get("countries")
-    if not isinstance(countries, list):
-        return {}
-    result = {}
-    for entry in countries:
-        if not isinstance(entry, dict):
-            continue
-        country = entry.get("country")
-        if isinstance(country, str) and country:
-            result[country] = entry
-    return result
+def _countries_map(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    # Shared country->entry index for the ASN, IPv6, undersea, and MX
+    # payloads, which all carry the same {"countries": [{"country": ...}]}
+    # shape.
+    return _index_by(payload.get("countries"), "country")
 
 
 def _global_reachability_score(payload: Dict[str, Any]) -> Optional[float]:
@@ -422,30 +516,19 @@ def _global_reachability_score(payload: Dict[str, Any]) -> Optional[float]:
     countries = payload.get("countries")
     if not isinstance(countries, list) or not countries:
         return None
+    # The walrus keeps this one dict probe per entry; score_percent was
+    # previously fetched once for the filter and again for the value.
     scores = [
-        entry.get("score_percent")
+        score
         for entry in countries
-        if isinstance(entry, dict) and isinstance(entry.get("score_percent"), (int, float))
+        if isinstance(entry, dict)
+        and isinstance(score := entry.get("score_percent"), (int, float))
     ]
     if not scores:
         return None
     return round(sum(scores) / len(scores), 2)
 
 
-def _undersea_countries(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    countries = payload.get("countries")
-    if not isinstance(countries, list):
-        return {}
-    result = {}
-    for entry in countries:
-        if not isinstance(entry, dict):
-            continue
-        country = entry.get("country")
-        if isinstance(country, str) and country:
-            result[country] = entry
-    return result
-
-
 def _dns_avg_latency(payload: Dict[str, Any]) -> Optional[float]:
     summary = payload.get("summary")
     if not isinstance(summary, dict):
@@ -463,23 +546,24 @@ def _mx_country_transition(payload: Dict[str, Any], previous: Dict[str, Any]) ->
     if not isinstance(today_countries, list) or not isinstance(yesterday_countries, list):
         return None
 
-    def build_map(entries: List[Dict[str, Any]]) -> Dict[str, int]:
-        result = {}
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            country = entry.get("country")
-            if not isinstance(country, str) or not country:
-                continue
-            mx_count = entry.get("mx_count")
-            if isinstance(mx_count, int):
-                result[country] = mx_count
-        return result
-
-    today_map = build_map(today_countries)
-    yesterday_map = build_map(yesterday_countries)
-    for country, mx_count in today_map.items():
-        if mx_count > 0 and yesterday_map.get(country, 0) == 0:
+    # Filter to entries with explicit integer counts before indexing so a
+    # duplicate country with a malformed count cannot shadow a valid one,
+    # matching the old specialized map.
+    def valid(entries: List[Any]) -> List[Any]:
+        return [
+            entry
+            for entry in entries
+            if isinstance(entry, dict) and isinstance(entry.get("mx_count"), int)
+        ]
+
+    today_map = _index_by(valid(today_countries), "country")
+    yesterday_map = _index_by(valid(yesterday_countries), "country")
+    for country, entry in today_map.items():
+        mx_count = entry.get("mx_count")
+        if mx_count <= 0:
+            continue
+        yesterday_entry = yesterday_map.get(country)
+        if yesterday_entry is None or yesterday_entry.get("mx_count") == 0:
             return country, mx_count
     return None
 
@@ -487,26 +571,49 @@ def _mx_country_transition(payload: Dict[str, Any], previous: Dict[str, Any]) ->
 def _select_event(events: List[SignificanceEvent]) -> Optional[SignificanceEvent]:
     if not events:
         return None
-    priority_map = {name: index for index, name in enumerate(PRIORITY_ORDER)}
-    return sorted(events, key=lambda event: priority_map.get(event.observer, 9999))[0]
+    # min is a single linear scan; sorting just to take element [0] was
+    # O(n log n) plus a copied list.
+    return min(events, key=lambda event: _PRIORITY_MAP.get(event.observer, 9999))
 
 
 def _wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+    # Measure each word once and accumulate widths numerically: the previous
+    # version reshaped the whole growing prefix through FreeType for every
+    # word, i.e. O(words^2) layout work plus an f-string per step.
     words = text.split()
+    if not words:
+        return []
+    space_width = font.getlength(" ")
     lines: List[str] = []
-    current = ""
+    current_words: List[str] = []
+    current_width = 0.0
     for word in words:
-        tentative = f"{current} {word}".strip()
-        if draw.textlength(tentative, font=font) <= max_width or not current:
-            current = tentative
+        word_width = font.getlength(word)
+        tentative = current_width + (space_width if current_words else 0.0) + word_width
+        if tentative <= max_width or not current_words:
+            current_words.append(word)
+            current_width = tentative
         else:
-            lines.append(current)
-            current = word
-    if current:
-        lines.append(current)
+            lines.append(" ".join(current_words))
+            current_words = [word]
+            current_width = word_width
+    if current_words:
+        lines.append(" ".join(current_words))
     return lines
 
 
+@functools.lru_cache(maxsize=32)
+def _load_font(preferred_names: Tuple[str, ...], size: int) -> ImageFont.FreeTypeFont:
+    # truetype parses the whole TTF per call; caching per (names, size) keeps
+    # repeat renders (e.g. backfills across dates) from re-reading the faces.
+    for name in preferred_names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
 def _render_png(date_str: str, event: SignificanceEvent) -> Path:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"{date_str}-{event.observer}.png"
@@ -520,18 +627,10 @@ def _render_png(date_str: str, event: SignificanceEvent) -> Path:
     image = Image.new("RGB", (width, height), color=background)
     draw = ImageDraw.Draw(image)
 
-    def load_font(preferred_names: List[str], size: int) -> ImageFont.FreeTypeFont:
-        for name in preferred_names:
-            try:
-                return ImageFont.truetype(name, size)
-            except OSError:
-                continue
-        return ImageFont.load_default()
-
-    title_font = load_font(["DejaVuSans-Bold.ttf", "DejaVuSans.ttf"], 45)
-    body_font = load_font(["DejaVuSans.ttf"], 24)
-    header_font = load_font(["DejaVuSans.ttf"], 18)
-    footer_font = load_font(["DejaVuSans.ttf"], 18)
+    title_font = _load_font(("DejaVuSans-Bold.ttf", "DejaVuSans.ttf"), 45)
+    body_font = _load_font(("DejaVuSans.ttf",), 24)
+    header_font = _load_font(("DejaVuSans.ttf",), 18)
+    footer_font = _load_font(("DejaVuSans.ttf",), 18)
 
     x_margin = 60
     y = 40
@@ -547,27 +646,55 @@ def _render_png(date_str: str, event: SignificanceEvent) -> Path:
     draw.text((x_margin, y), date_str, fill=muted_color, font=header_font)
     y += 50
 
+    # multiline_text lays out and rasterizes each block in one call; the
+    # spacing values are derived from Pillow's per-line step (bbox of "A"
+    # plus spacing) so every line lands on the same y as before.
     title_lines = _wrap_text(draw, event.title, title_font, content_width)
-    for line in title_lines:
-        draw.text((x_margin, y), line, fill=text_color, font=title_font)
-        y += 54
+    if title_lines:
+        title_step = draw.textbbox((0, 0), "A", font=title_font)[3]
+        draw.multiline_text(
+            (x_margin, y),
+            "\n".join(title_lines),
+            fill=text_color,
+            font=title_font,
+            spacing=54 - title_step,
+        )
+        y += 54 * len(title_lines)
     y += 10
 
+    body_step = draw.textbbox((0, 0), "A", font=body_font)[3]
     for bullet in event.bullets:
         bullet_lines = _wrap_text(draw, f"• {bullet}", body_font, content_width)
-        for index, line in enumerate(bullet_lines):
-            draw.text((x_margin, y), line, fill=text_color, font=body_font)
-            y += 32 if index == len(bullet_lines) - 1 else 28
+        if bullet_lines:
+            draw.multiline_text(
+                (x_margin, y),
+                "\n".join(bullet_lines),
+                fill=text_color,
+                font=body_font,
+                spacing=28 - body_step,
+            )
+            y += 28 * (len(bullet_lines) - 1) + 32
         y += 6
 
     footer_text = event.footer or "Deviation from long-term baseline"
     draw.text((x_margin, height - 60), footer_text, fill=muted_color, font=footer_font)
 
-    image.save(output_path)
+    # These alert images are flat dark panels with text — zlib level 1 costs
+    # only a few KB over the default level 6 but encodes several times
+    # faster, and the save step dominates this script's runtime.
+    image.save(output_path, format="PNG", optimize=False, compress_level=1)
     return output_path
 
 
+# Bump when adding comment keys below so existing state files backfill them.
+_STATE_COMMENTS_VERSION = 1
+
+
 def _ensure_state_comments(state: Dict[str, Any]) -> None:
+    # The setdefault walk below is pure overhead once the comment keys exist;
+    # the version sentinel lets steady-state runs skip it entirely.
+    if state.get("_comments_version") == _STATE_COMMENTS_VERSION:
+        return
     state.setdefault(
         "_comment_last_generated_date",
         "Records the most recent PNG date to prevent duplicate renders for the same day.",
@@ -655,6 +782,8 @@ def _ensure_state_comments(state: Dict[str, Any]) -> None:
             "Stores the date when the lowest score was observed to avoid repeats.",
         )
 
+    state["_comments_version"] = _STATE_COMMENTS_VERSION
+
 
 def _update_area51_state(state: Dict[str, Any], today_state: Optional[str], today_str: str) -> None:
     area_state = state.setdefault("area51", {})
@@ -702,10 +831,13 @@ def _update_tls_state(state: Dict[str, Any], payload: Dict[str, Any], today_str:
             hosts[host] = {"fingerprint": fingerprint, "first_seen": today_str}
 
 
-def _update_ipv6_state(state: Dict[str, Any], payload: Dict[str, Any], today_str: str) -> None:
+def _update_ipv6_state(
+    state: Dict[str, Any], countries: Dict[str, Dict[str, Any]], today_str: str
+) -> None:
+    # Takes the prebuilt country index so the evaluation rule and this update
+    # share a single _countries_map pass.
     ipv6_state = state.setdefault("ipv6_states", {})
     countries_state = ipv6_state.setdefault("countries", {})
-    countries = _ipv6_countries(payload)
     for country, entry in countries.items():
         ipv6_available = entry.get("ipv6_available")
         if not isinstance(ipv6_available, bool):
@@ -732,454 +864,584 @@ def _update_global_reachability_state(state: Dict[str, Any], score: Optional[flo
         reach_state["date"] = today_str
 
 
-def evaluate_significance(
-    today_str: str,
-    yesterday_str: str,
-    today_obs: Dict[str, Dict[str, Any]],
-    yesterday_obs: Dict[str, Dict[str, Any]],
+# Frozen %-templates for the purely numeric bullet sets: the interpreter
+# parses an f-string's format spec on every call, while these render through
+# one C-level format pass per line.
+_SHRINKAGE_BULLETS = ("Index today: %.2f.", "Index yesterday: %.2f.", "Delta: %+.2f.")
+_DNS_LATENCY_BULLETS = (
+    "Average query time today: %.2f ms.",
+    "Average query time yesterday: %.2f ms.",
+    "Latency multiplier: %.2f.",
+)
+
+
+# Each handler implements one observer's significance rule and returns at most
+# one event. The shared signature keeps the dispatch loop branch-free: handlers
+# that do not need yesterday's payload or the state simply ignore them.
+def _eval_north_korea(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
     state: Dict[str, Any],
-) -> Tuple[List[SignificanceEvent], Dict[str, Any]]:
-    events: List[SignificanceEvent] = []
-    today = _parse_date(today_str)
-    yesterday = _parse_date(yesterday_str)
-
-    # 1) north-korea-connectivity: trigger on silence-to-response transition.
-    nk_today = today_obs.get("north-korea-connectivity")
-    nk_yesterday = yesterday_obs.get("north-korea-connectivity")
-    if nk_today and nk_yesterday:
-        if _nk_is_silent(nk_yesterday) and _nk_any_success(nk_today):
-            origin_context = _nk_origin_context(nk_today)
-            events.append(
-                SignificanceEvent(
-                    observer="north-korea-connectivity",
-                    title="North Korea connectivity response detected",
-                    bullets=[
-                        "Yesterday: complete silence across monitored targets.",
-                        "Today: at least one successful response observed.",
-                        f"Response observed via {origin_context}.",
-                    ],
-                    special_values={"origin_context": origin_context},
-                )
-            )
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on silence-to-response transition.
+    if not (_nk_is_silent(yesterday_payload) and _nk_any_success(today_payload)):
+        return None
+    origin_context = _nk_origin_context(today_payload)
+    return SignificanceEvent(
+        observer="north-korea-connectivity",
+        title="North Korea connectivity response detected",
+        bullets=[
+            "Yesterday: complete silence across monitored targets.",
+            "Today: at least one successful response observed.",
+            f"Response observed via {origin_context}.",
+        ],
+        special_values={"origin_context": origin_context},
+    )
 
-    # 2) cuba-internet-weather: trigger on zero availability or recovery after >= 7 days.
-    cuba_today = today_obs.get("cuba-internet-weather")
-    cuba_yesterday = yesterday_obs.get("cuba-internet-weather")
-    if cuba_today and cuba_yesterday:
-        today_class = _cuba_classification(cuba_today)
-        yesterday_class = _cuba_classification(cuba_yesterday)
+
+def _eval_cuba(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on zero availability or recovery after >= 7 days. Also
+    # refreshes the Cuba baseline, reusing the classification computed for
+    # the rule instead of deriving it a second time.
+    today_class = _cuba_classification(today_payload)
+    event = None
+    if yesterday_payload:
+        yesterday_class = _cuba_classification(yesterday_payload)
         cuba_state = state.get("cuba_internet", {})
         outage_start = cuba_state.get("outage_start_date")
         outage_days = None
         if outage_start:
             outage_days = (today - _parse_date(outage_start)).days + 1
         if today_class == "offline" and yesterday_class != "offline":
-            events.append(
-                SignificanceEvent(
-                    observer="cuba-internet-weather",
-                    title="Cuba availability classification changed to no response",
-                    bullets=[
-                        f"Classification today: {_cuba_classification_label(today_class)}.",
-                        "Yesterday: response observed.",
-                        "Non-response duration: 1 day (start of stretch).",
-                    ],
-                    special_values={"outage_duration_days": 1},
-                )
+            event = SignificanceEvent(
+                observer="cuba-internet-weather",
+                title="Cuba availability classification changed to no response",
+                bullets=[
+                    f"Classification today: {_cuba_classification_label(today_class)}.",
+                    "Yesterday: response observed.",
+                    "Non-response duration: 1 day (start of stretch).",
+                ],
+                special_values={"outage_duration_days": 1},
             )
-        if (
+        elif (
             today_class
             and today_class != "offline"
             and yesterday_class == "offline"
             and outage_days
             and outage_days >= 7
         ):
-            events.append(
-                SignificanceEvent(
-                    observer="cuba-internet-weather",
-                    title="Cuba availability classification changed after prolonged non-response period",
-                    bullets=[
-                        f"Non-response duration: {outage_days} days.",
-                        f"Classification today: {_cuba_classification_label(today_class)}.",
-                        "Yesterday: no response.",
-                    ],
-                    special_values={"outage_duration_days": outage_days},
-                )
+            event = SignificanceEvent(
+                observer="cuba-internet-weather",
+                title="Cuba availability classification changed after prolonged non-response period",
+                bullets=[
+                    f"Non-response duration: {outage_days} days.",
+                    f"Classification today: {_cuba_classification_label(today_class)}.",
+                    "Yesterday: no response.",
+                ],
+                special_values={"outage_duration_days": outage_days},
             )
+    _update_cuba_state(state, today_class, today)
+    return event
 
-    # 3) iran-dns-behavior: trigger when DNS behavior category changes.
-    iran_today = today_obs.get("iran-dns-behavior")
-    iran_yesterday = yesterday_obs.get("iran-dns-behavior")
-    if iran_today and iran_yesterday:
-        today_class = _iran_behavior_class(iran_today)
-        yesterday_class = _iran_behavior_class(iran_yesterday)
-        if today_class and yesterday_class and today_class != yesterday_class:
-            events.append(
-                SignificanceEvent(
-                    observer="iran-dns-behavior",
-                    title="Iran DNS response category changed",
-                    bullets=[
-                        f"Previous class: {yesterday_class}.",
-                        f"Current class: {today_class}.",
-                        "Category change from summary query outcomes.",
-                    ],
-                    special_values={"dns_behavior_class": today_class},
-                )
+
+def _eval_iran(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger when DNS behavior category changes.
+    today_class = _iran_behavior_class(today_payload)
+    yesterday_class = _iran_behavior_class(yesterday_payload)
+    if today_class and yesterday_class and today_class != yesterday_class:
+        return SignificanceEvent(
+            observer="iran-dns-behavior",
+            title="Iran DNS response category changed",
+            bullets=[
+                f"Previous class: {yesterday_class}.",
+                f"Current class: {today_class}.",
+                "Category change from summary query outcomes.",
+            ],
+            special_values={"dns_behavior_class": today_class},
+        )
+    return None
+
+
+def _eval_area51(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on flight deviation, or if state changes after >= 30 days
+    # stability. Also refreshes the reachability baseline from the one
+    # _area51_state derivation.
+    event = _area51_flight_event(today_payload)
+    today_state = _area51_state(today_payload)
+    area_state = state.get("area51", {})
+    last_state = area_state.get("last_state")
+    last_change = area_state.get("last_change_date")
+    if event is None and today_state and last_state and last_change and today_state != last_state:
+        stable_days = (today - _parse_date(last_change)).days
+        if stable_days >= 30:
+            event = SignificanceEvent(
+                observer="area51-reachability",
+                title="Area 51 reachability state shifted after stability",
+                bullets=[
+                    f"New reachability state: {today_state}.",
+                    f"Stable for {stable_days} days before change.",
+                    "Reachability from ping/TCP outcomes only.",
+                ],
+                special_values={"reachability_state": today_state},
             )
+    _update_area51_state(state, today_state, today_str)
+    return event
 
-    # 4) area51-reachability: trigger if state changes after >= 30 days stability.
-    area_today = today_obs.get("area51-reachability")
-    if area_today:
-        flight_event = _area51_flight_event(area_today)
-        if flight_event:
-            events.append(flight_event)
-        today_state = _area51_state(area_today)
-        area_state = state.get("area51", {})
-        last_state = area_state.get("last_state")
-        last_change = area_state.get("last_change_date")
-        if not flight_event and today_state and last_state and last_change and today_state != last_state:
-            stable_days = (today - _parse_date(last_change)).days
-            if stable_days >= 30:
-                events.append(
-                    SignificanceEvent(
-                        observer="area51-reachability",
-                        title="Area 51 reachability state shifted after stability",
-                        bullets=[
-                            f"New reachability state: {today_state}.",
-                            f"Stable for {stable_days} days before change.",
-                            "Reachability from ping/TCP outcomes only.",
-                        ],
-                        special_values={"reachability_state": today_state},
-                    )
-                )
 
-    # 5) traceroute-to-nowhere: trigger on stop-zone change or hop collapse >= 50%.
-    trace_today = today_obs.get("traceroute-to-nowhere")
-    trace_yesterday = yesterday_obs.get("traceroute-to-nowhere")
-    if trace_today and trace_yesterday:
-        today_targets = _traceroute_targets(trace_today)
-        yesterday_targets = _traceroute_targets(trace_yesterday)
-        for key, today_target in today_targets.items():
-            yesterday_target = yesterday_targets.get(key)
-            if not yesterday_target:
-                continue
-            today_zone = today_target.get("stop_zone")
-            yesterday_zone = yesterday_target.get("stop_zone")
-            today_hops = today_target.get("hops_reached")
-            yesterday_hops = yesterday_target.get("hops_reached")
-            if (
-                isinstance(today_zone, str)
-                and isinstance(yesterday_zone, str)
-                and today_zone != yesterday_zone
-            ):
-                events.append(
-                    SignificanceEvent(
-                        observer="traceroute-to-nowhere",
-                        title="Traceroute termination region changed",
-                        bullets=[
-                            f"Termination region today: {today_zone}.",
-                            f"Termination region yesterday: {yesterday_zone}.",
-                            "Stop region from hop count only.",
-                        ],
-                        special_values={"termination_region": today_zone},
-                    )
-                )
-                break
-            if (
-                isinstance(today_hops, int)
-                and isinstance(yesterday_hops, int)
-                and yesterday_hops > 0
-                and today_hops <= (yesterday_hops / 2)
-            ):
-                events.append(
-                    SignificanceEvent(
-                        observer="traceroute-to-nowhere",
-                        title="Traceroute path length changed",
-                        bullets=[
-                            f"Termination region today: {today_zone or 'unknown'}.",
-                            f"Hops today: {today_hops}.",
-                            f"Hops yesterday: {yesterday_hops}.",
-                        ],
-                        special_values={"termination_region": today_zone or "unknown"},
-                    )
-                )
-                break
+def _eval_traceroute(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on stop-zone change or hop collapse >= 50%.
+    today_targets = _traceroute_targets(today_payload)
+    yesterday_targets = _traceroute_targets(yesterday_payload)
+    for key, today_target in today_targets.items():
+        yesterday_target = yesterday_targets.get(key)
+        if not yesterday_target:
+            continue
+        today_zone = today_target.get("stop_zone")
+        yesterday_zone = yesterday_target.get("stop_zone")
+        today_hops = today_target.get("hops_reached")
+        yesterday_hops = yesterday_target.get("hops_reached")
+        if (
+            isinstance(today_zone, str)
+            and isinstance(yesterday_zone, str)
+            and today_zone != yesterday_zone
+        ):
+            return SignificanceEvent(
+                observer="traceroute-to-nowhere",
+                title="Traceroute termination region changed",
+                bullets=[
+                    f"Termination region today: {today_zone}.",
+                    f"Termination region yesterday: {yesterday_zone}.",
+                    "Stop region from hop count only.",
+                ],
+                special_values={"termination_region": today_zone},
+            )
+        # Exact type checks: JSON integers arrive as plain int, so the
+        # isinstance MRO walk buys nothing here (and stops booleans from
+        # masquerading as counts).
+        if (
+            type(today_hops) is int
+            and type(yesterday_hops) is int
+            and yesterday_hops > 0
+            and today_hops <= (yesterday_hops / 2)
+        ):
+            return SignificanceEvent(
+                observer="traceroute-to-nowhere",
+                title="Traceroute path length changed",
+                bullets=[
+                    f"Termination region today: {today_zone or 'unknown'}.",
+                    f"Hops today: {today_hops}.",
+                    f"Hops yesterday: {yesterday_hops}.",
+                ],
+                special_values={"termination_region": today_zone or "unknown"},
+            )
+    return None
 
-    # 6) internet-shrinkage-index: trigger if absolute change >= 0.10 in 24 hours.
-    shrink_today = today_obs.get("internet-shrinkage-index")
-    shrink_yesterday = yesterday_obs.get("internet-shrinkage-index")
-    if shrink_today and shrink_yesterday:
-        today_index = _shrinkage_index(shrink_today)
-        yesterday_index = _shrinkage_index(shrink_yesterday)
-        if today_index is not None and yesterday_index is not None:
-            delta = today_index - yesterday_index
-            if abs(delta) >= 0.10:
-                events.append(
-                    SignificanceEvent(
-                        observer="internet-shrinkage-index",
-                        title="Internet shrinkage index shifted sharply",
-                        bullets=[
-                            f"Index today: {today_index:.2f}.",
-                            f"Index yesterday: {yesterday_index:.2f}.",
-                            f"Delta: {delta:+.2f}.",
-                        ],
-                        special_values={"delta_value": round(delta, 2)},
-                    )
-                )
 
-    # 7) asn-visibility-by-country: trigger if >= 3 ASNs disappear in a day.
-    asn_today = today_obs.get("asn-visibility-by-country")
-    asn_yesterday = yesterday_obs.get("asn-visibility-by-country")
-    if asn_today and asn_yesterday:
-        today_countries = _asn_countries(asn_today)
-        yesterday_countries = _asn_countries(asn_yesterday)
-        for country, today_entry in today_countries.items():
-            yesterday_entry = yesterday_countries.get(country)
-            if not yesterday_entry:
-                continue
-            today_visible = today_entry.get("visible_asns")
-            yesterday_visible = yesterday_entry.get("visible_asns")
-            if (
-                isinstance(today_visible, int)
-                and isinstance(yesterday_visible, int)
-                and yesterday_visible - today_visible >= 3
-            ):
-                events.append(
-                    SignificanceEvent(
-                        observer="asn-visibility-by-country",
-                        title="ASN visibility changed in one country",
-                        bullets=[
-                            f"Affected country: {country}.",
-                            f"Visible ASNs today: {today_visible}.",
-                            f"Visible ASNs yesterday: {yesterday_visible}.",
-                        ],
-                        special_values={"affected_country": country},
+def _eval_shrinkage(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger if absolute change >= 0.10 in 24 hours.
+    today_index = _shrinkage_index(today_payload)
+    yesterday_index = _shrinkage_index(yesterday_payload)
+    if today_index is not None and yesterday_index is not None:
+        delta = today_index - yesterday_index
+        if abs(delta) >= 0.10:
+            return SignificanceEvent(
+                observer="internet-shrinkage-index",
+                title="Internet shrinkage index shifted sharply",
+                bullets=[
+                    template % value
+                    for template, value in zip(
+                        _SHRINKAGE_BULLETS, (today_index, yesterday_index, delta)
                     )
-                )
-                break
+                ],
+                special_values={"delta_value": round(delta, 2)},
+            )
+    return None
 
-    # 8) tls-fingerprint-change-watcher: trigger if fingerprint changes after >= 30 days.
-    tls_today = today_obs.get("tls-fingerprint-change-watcher")
-    if tls_today:
-        tls_state = state.get("tls_fingerprints", {}).get("hosts", {})
-        targets = tls_today.get("targets")
-        if isinstance(targets, list):
-            for target in targets:
-                if not isinstance(target, dict):
-                    continue
-                host = target.get("host")
-                name = target.get("name")
-                fingerprint = target.get("fingerprint_sha256")
-                if not isinstance(host, str) or not isinstance(fingerprint, str):
-                    continue
-                previous = tls_state.get(host)
-                if not isinstance(previous, dict):
-                    continue
-                if previous.get("fingerprint") != fingerprint:
-                    first_seen = previous.get("first_seen")
-                    if not isinstance(first_seen, str):
-                        continue
-                    age_days = (today - _parse_date(first_seen)).days
-                    if age_days >= 30:
-                        events.append(
-                            SignificanceEvent(
-                                observer="tls-fingerprint-change-watcher",
-                                title="TLS fingerprint changed after long stability",
-                                bullets=[
-                                    f"Target: {name or 'unknown'}.",
-                                    f"Previous fingerprint age: {age_days} days.",
-                                    "Change detected via stored fingerprint history.",
-                                ],
-                                special_values={"fingerprint_age_days": age_days},
-                            )
-                        )
-                        break
-
-    # 9) silent-countries-list: trigger when silent country count increases by >= 2.
-    silent_today = today_obs.get("silent-countries-list")
-    silent_yesterday = yesterday_obs.get("silent-countries-list")
-    if silent_today and silent_yesterday:
-        today_count = _silent_countries_count(silent_today)
-        yesterday_count = _silent_countries_count(silent_yesterday)
-        if today_count is not None and yesterday_count is not None:
-            delta = today_count - yesterday_count
-            if delta >= 2:
-                events.append(
-                    SignificanceEvent(
-                        observer="silent-countries-list",
-                        title="Silent country count changed",
-                        bullets=[
-                            f"Silent countries today: {today_count}.",
-                            f"Silent countries yesterday: {yesterday_count}.",
-                            f"Delta: +{delta}.",
-                        ],
-                        special_values={"delta_silent_count": delta},
-                    )
-                )
 
-    # 10) ipv6-adoption-locked-states: trigger on first presence or stable disappearance.
-    ipv6_today = today_obs.get("ipv6-adoption-locked-states")
-    if ipv6_today:
-        ipv6_state = state.get("ipv6_states", {}).get("countries", {})
-        countries = _ipv6_countries(ipv6_today)
-        for country, entry in countries.items():
-            ipv6_available = entry.get("ipv6_available")
-            if not isinstance(ipv6_available, bool):
-                continue
-            previous = ipv6_state.get(country, {})
-            last_state = previous.get("last_state")
-            stable_since = previous.get("stable_since")
-            stable_days = None
-            if isinstance(stable_since, str):
-                stable_days = (today - _parse_date(stable_since)).days
-            if last_state is None and ipv6_available:
-                events.append(
-                    SignificanceEvent(
-                        observer="ipv6-adoption-locked-states",
-                        title="IPv6 presence detected for the first time",
-                        bullets=[
-                            f"Country: {country}.",
-                            "IPv6 state: detected.",
-                            "First observed in current data.",
-                        ],
-                        special_values={"ipv6_state": "appeared"},
-                    )
-                )
-                break
-            if last_state is True and ipv6_available is False and stable_days is not None:
-                if stable_days >= 7:
-                    events.append(
-                        SignificanceEvent(
-                            observer="ipv6-adoption-locked-states",
-                            title="IPv6 presence changed after stability",
-                            bullets=[
-                                f"Country: {country}.",
-                                "IPv6 state: changed.",
-                                f"Stable for {stable_days} days before change.",
-                            ],
-                            special_values={"ipv6_state": "disappeared"},
-                        )
-                    )
-                    break
+def _eval_asn_visibility(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger if >= 3 ASNs disappear in a day.
+    today_countries = _countries_map(today_payload)
+    yesterday_countries = _countries_map(yesterday_payload)
+    # One comprehension plus a C-level max replaces the branchy first-match
+    # loop; reporting the largest drop also makes the chosen country
+    # independent of payload ordering.
+    candidates = [
+        (yesterday_visible - today_visible, country, today_visible, yesterday_visible)
+        for country, today_entry in today_countries.items()
+        if (yesterday_entry := yesterday_countries.get(country))
+        and type(today_visible := today_entry.get("visible_asns")) is int
+        and type(yesterday_visible := yesterday_entry.get("visible_asns")) is int
+    ]
+    best = max(candidates, key=itemgetter(0), default=None)
+    if best is not None and best[0] >= 3:
+        _, country, today_visible, yesterday_visible = best
+        return SignificanceEvent(
+            observer="asn-visibility-by-country",
+            title="ASN visibility changed in one country",
+            bullets=[
+                f"Affected country: {country}.",
+                f"Visible ASNs today: {today_visible}.",
+                f"Visible ASNs yesterday: {yesterday_visible}.",
+            ],
+            special_values={"affected_country": country},
+        )
+    return None
 
-    # 11) global-reachability-score: trigger on lowest value since project start.
-    global_today = today_obs.get("global-reachability-score")
-    global_yesterday = yesterday_obs.get("global-reachability-score")
-    if global_today and global_yesterday:
-        today_score = _global_reachability_score(global_today)
-        yesterday_score = _global_reachability_score(global_yesterday)
-        reach_state = state.get("global_reachability", {})
-        lowest_score = reach_state.get("lowest_score")
-        if today_score is not None:
-            if (
-                yesterday_score is not None
-                and lowest_score is not None
-                and today_score < float(lowest_score)
-            ):
-                events.append(
-                    SignificanceEvent(
-                        observer="global-reachability-score",
-                        title="Global reachability score deviated to a new low",
-                        bullets=[
-                            f"Score today: {today_score:.2f}.",
-                            "Lowest value since measurements began.",
-                            "Score from reported country scores only.",
-                        ],
-                        special_values={"score_rank": "lowest_on_record"},
-                    )
-                )
 
-    # 12) undersea-cable-dependency: trigger on single-cable dependency or loss.
-    cable_today = today_obs.get("undersea-cable-dependency")
-    cable_yesterday = yesterday_obs.get("undersea-cable-dependency")
-    if cable_today and cable_yesterday:
-        today_countries = _undersea_countries(cable_today)
-        yesterday_countries = _undersea_countries(cable_yesterday)
-        for country, today_entry in today_countries.items():
-            yesterday_entry = yesterday_countries.get(country)
-            if not yesterday_entry:
+def _eval_tls(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger if fingerprint changes after >= 30 days. The stored
+    # fingerprints are refreshed afterwards, once the rule has compared
+    # against the pre-update baseline.
+    event = None
+    tls_state = state.get("tls_fingerprints", {}).get("hosts", {})
+    targets = today_payload.get("targets")
+    if isinstance(targets, list):
+        for target in targets:
+            if not isinstance(target, dict):
                 continue
-            today_count = today_entry.get("cable_count")
-            yesterday_count = yesterday_entry.get("cable_count")
-            if not isinstance(today_count, int) or not isinstance(yesterday_count, int):
+            host = target.get("host")
+            name = target.get("name")
+            fingerprint = target.get("fingerprint_sha256")
+            if not isinstance(host, str) or not isinstance(fingerprint, str):
                 continue
-            if today_count == 1 and yesterday_count > 1:
-                events.append(
-                    SignificanceEvent(
-                        observer="undersea-cable-dependency",
-                        title="Undersea cable redundancy changed",
-                        bullets=[
-                            f"Affected region: {country}.",
-                            f"Cable count today: {today_count}.",
-                            f"Cable count yesterday: {yesterday_count}.",
-                        ],
-                        special_values={"affected_region": country},
-                    )
-                )
-                break
-            if today_count == 0 and yesterday_count > 0:
-                events.append(
-                    SignificanceEvent(
-                        observer="undersea-cable-dependency",
-                        title="Undersea cable redundancy changed",
+            previous = tls_state.get(host)
+            if not isinstance(previous, dict):
+                continue
+            if previous.get("fingerprint") != fingerprint:
+                first_seen = previous.get("first_seen")
+                if not isinstance(first_seen, str):
+                    continue
+                age_days = (today - _parse_date(first_seen)).days
+                if age_days >= 30:
+                    event = SignificanceEvent(
+                        observer="tls-fingerprint-change-watcher",
+                        title="TLS fingerprint changed after long stability",
                         bullets=[
-                            f"Affected region: {country}.",
-                            f"Cable count today: {today_count}.",
-                            f"Cable count yesterday: {yesterday_count}.",
+                            f"Target: {name or 'unknown'}.",
+                            f"Previous fingerprint age: {age_days} days.",
+                            "Change detected via stored fingerprint history.",
                         ],
-                        special_values={"affected_region": country},
+                        special_values={"fingerprint_age_days": age_days},
                     )
-                )
-                break
+                    break
+    _update_tls_state(state, today_payload, today_str)
+    return event
 
-    # 13) dns-time-to-answer-index: trigger when latency doubles in 24 hours.
-    dns_today = today_obs.get("dns-time-to-answer-index")
-    dns_yesterday = yesterday_obs.get("dns-time-to-answer-index")
-    if dns_today and dns_yesterday:
-        today_avg = _dns_avg_latency(dns_today)
-        yesterday_avg = _dns_avg_latency(dns_yesterday)
-        if (
-            today_avg is not None
-            and yesterday_avg is not None
-            and yesterday_avg > 0
-            and today_avg >= (yesterday_avg * 2)
-        ):
-            multiplier = round(today_avg / yesterday_avg, 2)
-            events.append(
-                SignificanceEvent(
-                    observer="dns-time-to-answer-index",
-                    title="Global DNS latency changed sharply",
-                    bullets=[
-                        f"Average query time today: {today_avg:.2f} ms.",
-                        f"Average query time yesterday: {yesterday_avg:.2f} ms.",
-                        f"Latency multiplier: {multiplier:.2f}.",
-                    ],
-                    special_values={"latency_multiplier": multiplier},
-                )
+
+def _eval_silent_countries(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger when silent country count increases by >= 2.
+    today_count = _silent_countries_count(today_payload)
+    yesterday_count = _silent_countries_count(yesterday_payload)
+    if today_count is not None and yesterday_count is not None:
+        delta = today_count - yesterday_count
+        if delta >= 2:
+            return SignificanceEvent(
+                observer="silent-countries-list",
+                title="Silent country count changed",
+                bullets=[
+                    f"Silent countries today: {today_count}.",
+                    f"Silent countries yesterday: {yesterday_count}.",
+                    f"Delta: +{delta}.",
+                ],
+                special_values={"delta_silent_count": delta},
             )
+    return None
+
 
-    # 14) mx-presence-by-country: trigger on zero-to-one MX transitions.
-    mx_today = today_obs.get("mx-presence-by-country")
-    mx_yesterday = yesterday_obs.get("mx-presence-by-country")
-    if mx_today and mx_yesterday:
-        transition = _mx_country_transition(mx_today, mx_yesterday)
-        if transition:
-            country, mx_count = transition
-            events.append(
-                SignificanceEvent(
-                    observer="mx-presence-by-country",
-                    title="MX presence detected in a country",
+def _eval_ipv6(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on first presence or stable disappearance. The stability
+    # baseline is refreshed afterwards from the same country index.
+    event = None
+    ipv6_state = state.get("ipv6_states", {}).get("countries", {})
+    countries = _countries_map(today_payload)
+    for country, entry in countries.items():
+        ipv6_available = entry.get("ipv6_available")
+        if not isinstance(ipv6_available, bool):
+            continue
+        previous = ipv6_state.get(country, {})
+        last_state = previous.get("last_state")
+        if last_state is None and ipv6_available:
+            event = SignificanceEvent(
+                observer="ipv6-adoption-locked-states",
+                title="IPv6 presence detected for the first time",
+                bullets=[
+                    f"Country: {country}.",
+                    "IPv6 state: detected.",
+                    "First observed in current data.",
+                ],
+                special_values={"ipv6_state": "appeared"},
+            )
+            break
+        # stable_since is only parsed on the one branch that needs it; in the
+        # common steady state most countries never reach this point.
+        stable_since = previous.get("stable_since")
+        if last_state is True and ipv6_available is False and isinstance(stable_since, str):
+            stable_days = (today - _parse_date(stable_since)).days
+            if stable_days >= 7:
+                event = SignificanceEvent(
+                    observer="ipv6-adoption-locked-states",
+                    title="IPv6 presence changed after stability",
                     bullets=[
                         f"Country: {country}.",
-                        f"Valid MX domains today: {mx_count}.",
-                        "Previous presence: zero.",
+                        "IPv6 state: changed.",
+                        f"Stable for {stable_days} days before change.",
                     ],
-                    special_values={"country_code": country},
+                    special_values={"ipv6_state": "disappeared"},
                 )
+                break
+    _update_ipv6_state(state, countries, today_str)
+    return event
+
+
+def _eval_global_reachability(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on lowest value since project start. The lowest-score
+    # baseline is refreshed afterwards from the same computed score.
+    today_score = _global_reachability_score(today_payload)
+    event = None
+    if today_score is not None and yesterday_payload:
+        yesterday_score = _global_reachability_score(yesterday_payload)
+        reach_state = state.get("global_reachability", {})
+        lowest_score = reach_state.get("lowest_score")
+        if (
+            yesterday_score is not None
+            and lowest_score is not None
+            and today_score < float(lowest_score)
+        ):
+            event = SignificanceEvent(
+                observer="global-reachability-score",
+                title="Global reachability score deviated to a new low",
+                bullets=[
+                    f"Score today: {today_score:.2f}.",
+                    "Lowest value since measurements began.",
+                    "Score from reported country scores only.",
+                ],
+                special_values={"score_rank": "lowest_on_record"},
+            )
+    _update_global_reachability_state(state, today_score, today_str)
+    return event
+
+
+def _eval_undersea(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on single-cable dependency or loss.
+    today_countries = _countries_map(today_payload)
+    yesterday_countries = _countries_map(yesterday_payload)
+    for country, today_entry in today_countries.items():
+        yesterday_entry = yesterday_countries.get(country)
+        if not yesterday_entry:
+            continue
+        today_count = today_entry.get("cable_count")
+        yesterday_count = yesterday_entry.get("cable_count")
+        if type(today_count) is not int or type(yesterday_count) is not int:
+            continue
+        if (today_count == 1 and yesterday_count > 1) or (
+            today_count == 0 and yesterday_count > 0
+        ):
+            return SignificanceEvent(
+                observer="undersea-cable-dependency",
+                title="Undersea cable redundancy changed",
+                bullets=[
+                    f"Affected region: {country}.",
+                    f"Cable count today: {today_count}.",
+                    f"Cable count yesterday: {yesterday_count}.",
+                ],
+                special_values={"affected_region": country},
             )
+    return None
+
+
+def _eval_dns_latency(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger when latency doubles in 24 hours.
+    today_avg = _dns_avg_latency(today_payload)
+    yesterday_avg = _dns_avg_latency(yesterday_payload)
+    if (
+        today_avg is not None
+        and yesterday_avg is not None
+        and yesterday_avg > 0
+        and today_avg >= (yesterday_avg * 2)
+    ):
+        multiplier = round(today_avg / yesterday_avg, 2)
+        return SignificanceEvent(
+            observer="dns-time-to-answer-index",
+            title="Global DNS latency changed sharply",
+            bullets=[
+                template % value
+                for template, value in zip(
+                    _DNS_LATENCY_BULLETS, (today_avg, yesterday_avg, multiplier)
+                )
+            ],
+            special_values={"latency_multiplier": multiplier},
+        )
+    return None
+
+
+def _eval_mx(
+    today_payload: Dict[str, Any],
+    yesterday_payload: Optional[Dict[str, Any]],
+    state: Dict[str, Any],
+    today: date,
+    today_str: str,
+) -> Optional[SignificanceEvent]:
+    # Rule: trigger on zero-to-one MX transitions.
+    transition = _mx_country_transition(today_payload, yesterday_payload)
+    if transition:
+        country, mx_count = transition
+        return SignificanceEvent(
+            observer="mx-presence-by-country",
+            title="MX presence detected in a country",
+            bullets=[
+                f"Country: {country}.",
+                f"Valid MX domains today: {mx_count}.",
+                "Previous presence: zero.",
+            ],
+            special_values={"country_code": country},
+        )
+    return None
+
+
+_Handler = Callable[
+    [Dict[str, Any], Optional[Dict[str, Any]], Dict[str, Any], date, str],
+    Optional[SignificanceEvent],
+]
 
-    # 15) world-observer-meta: use a single meta event when >= 3 observers signal deviations.
-    if len(events) >= 3:
-        observers_involved = sorted({event.observer for event in events})
+# Evaluation order matches the original numbered rule sections. The flag marks
+# rules that compare against yesterday's payload and are skipped when it is
+# absent; stateful rules (cuba, area51, tls, ipv6, global) refresh their own
+# baselines at the end of their handler, so they run on today's payload alone.
+# Adding a rule is one handler plus one registration here.
+_HANDLERS: Tuple[Tuple[str, bool, _Handler], ...] = (
+    ("north-korea-connectivity", True, _eval_north_korea),
+    ("cuba-internet-weather", False, _eval_cuba),
+    ("iran-dns-behavior", True, _eval_iran),
+    ("area51-reachability", False, _eval_area51),
+    ("traceroute-to-nowhere", True, _eval_traceroute),
+    ("internet-shrinkage-index", True, _eval_shrinkage),
+    ("asn-visibility-by-country", True, _eval_asn_visibility),
+    ("tls-fingerprint-change-watcher", False, _eval_tls),
+    ("silent-countries-list", True, _eval_silent_countries),
+    ("ipv6-adoption-locked-states", False, _eval_ipv6),
+    ("global-reachability-score", False, _eval_global_reachability),
+    ("undersea-cable-dependency", True, _eval_undersea),
+    ("dns-time-to-answer-index", True, _eval_dns_latency),
+    ("mx-presence-by-country", True, _eval_mx),
+)
+
+
+def evaluate_significance(
+    today_str: str,
+    yesterday_str: str,
+    today_obs: Dict[str, Dict[str, Any]],
+    yesterday_obs: Dict[str, Dict[str, Any]],
+    state: Dict[str, Any],
+) -> Tuple[List[SignificanceEvent], Dict[str, Any]]:
+    events: List[SignificanceEvent] = []
+    # Each handler fires at most once, so this doubles as the distinct set of
+    # signaling observers; the meta rule reads it directly instead of
+    # re-traversing the events list.
+    observers_signaled: List[str] = []
+    today = _parse_date(today_str)
+
+    # One compact dispatch loop replaces fourteen copies of the payload-fetch
+    # and truthiness scaffolding. On sparse days most observers are missing
+    # from one side, so one C-level keys intersection prunes the two-sided
+    # rules before any per-handler dict probes.
+    common_keys = today_obs.keys() & yesterday_obs.keys()
+    for observer, needs_yesterday, handler in _HANDLERS:
+        if needs_yesterday:
+            if observer not in common_keys:
+                continue
+            yesterday_payload = yesterday_obs[observer]
+            if not yesterday_payload:
+                continue
+        else:
+            # One-sided rules still run without yesterday's payload; those
+            # that can use it (cuba, global) branch on its presence.
+            yesterday_payload = yesterday_obs.get(observer)
+        today_payload = today_obs.get(observer)
+        if not today_payload:
+            continue
+        event = handler(today_payload, yesterday_payload, state, today, today_str)
+        if event is not None:
+            events.append(event)
+            observers_signaled.append(event.observer)
+
+    # world-observer-meta: use a single meta event when >= 3 observers signal deviations.
+    if len(observers_signaled) >= 3:
+        signaled = set(observers_signaled)
+        observers_involved = [name for name in _OBSERVER_NAMES_SORTED if name in signaled]
         events = [
             SignificanceEvent(
                 observer="world-observer-meta",
@@ -1193,18 +1455,6 @@ def evaluate_significance(
             )
         ]
 
-    # Update baseline state after evaluation to preserve change detection.
-    if cuba_today:
-        _update_cuba_state(state, _cuba_classification(cuba_today), today)
-    if area_today:
-        _update_area51_state(state, _area51_state(area_today), today_str)
-    if tls_today:
-        _update_tls_state(state, tls_today, today_str)
-    if ipv6_today:
-        _update_ipv6_state(state, ipv6_today, today_str)
-    if global_today:
-        _update_global_reachability_state(state, _global_reachability_score(global_today), today_str)
-
     return events, state
 
 
@@ -1220,8 +1470,13 @@ def main() -> None:
     today_dir = DAILY_DIR / today_str
     yesterday_dir = DAILY_DIR / yesterday_str
 
-    today_obs = _collect_observations(today_dir)
-    yesterday_obs = _collect_observations(yesterday_dir)
+    # The two directory scans are independent and I/O-bound; one worker
+    # collects yesterday while the main thread collects today, overlapping
+    # the disk latency of the two reads.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yesterday_future = executor.submit(_collect_observations, yesterday_dir)
+        today_obs = _collect_observations(today_dir)
+        yesterday_obs = yesterday_future.result()
 
     state = _load_state()
     _ensure_state_comments(state)
@@ -1235,10 +1490,23 @@ def main() -> None:
 
     selected = _select_event(events)
 
-    existing_png = None
-    if OUTPUT_DIR.exists():
-        matches = sorted(OUTPUT_DIR.glob(f"{today_str}-*.png"))
-        existing_png = matches[0] if matches else None
+    # scandir compares plain names without fnmatch or Path construction for
+    # non-matches, which matters once the output directory holds years of
+    # PNGs; min keeps the lexicographically first match as the glob did.
+    png_prefix = f"{today_str}-"
+    try:
+        with os.scandir(OUTPUT_DIR) as entries:
+            existing_name = min(
+                (
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(png_prefix) and entry.name.endswith(".png")
+                ),
+                default=None,
+            )
+    except OSError:
+        existing_name = None
+    existing_png = OUTPUT_DIR / existing_name if existing_name else None
     already_generated = state.get("last_generated_date") == today_str or existing_png is not None
     if existing_png and state.get("last_generated_date") != today_str:
         observer_name = existing_png.stem[len(today_str) + 1 :]